@@ -1,52 +1,54 @@
 import streamlit as st
+from theme import use_style
+from Days.registry import go_to_day
+
+WHY_CSS = """
+    .heart-float {
+        position: absolute;
+        color: #06b6d4;
+        font-size: 1.5rem;
+        animation: float 6s ease-in-out infinite;
+    }
+    @keyframes float {
+        0%, 100% { transform: translateY(0px); }
+        50% { transform: translateY(-20px); }
+    }
+    .heart-1 { top: 10%; left: 10%; animation-delay: 0s; }
+    .heart-2 { top: 20%; right: 15%; animation-delay: 2s; }
+    .heart-3 { bottom: 30%; left: 20%; animation-delay: 4s; }
+    .heart-4 { bottom: 20%; right: 10%; animation-delay: 1s; }
+
+    .why-title {
+        text-align: center;
+        font-size: 3.2rem;
+        font-weight: bold;
+        margin-top: 2.5rem;
+        margin-bottom: 1.2rem;
+        background: linear-gradient(90deg, #06b6d4 10%, #8b5cf6 60%, #f472b6 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        letter-spacing: 2px;
+        text-shadow: 0 2px 12px rgba(139,92,246,0.15);
+    }
+    .why-desc {
+        text-align: left; /* <-- changed from center to left */
+        font-size: 1.15rem;
+        font-weight: 500;
+        margin: 0 auto 2.5rem auto;
+        max-width: 600px;
+        background: linear-gradient(90deg, #06b6d4 10%, #8b5cf6 60%, #f472b6 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        background-clip: text;
+        letter-spacing: 1px;
+    }
+"""
 
 def show_why_i_made_you_screen():
     """Show the beautiful title, floating emojis, navigation buttons, and a gradient message."""
 
-    st.markdown("""
-    <style>
-        .heart-float {
-            position: absolute;
-            color: #06b6d4;
-            font-size: 1.5rem;
-            animation: float 6s ease-in-out infinite;
-        }
-        @keyframes float {
-            0%, 100% { transform: translateY(0px); }
-            50% { transform: translateY(-20px); }
-        }
-        .heart-1 { top: 10%; left: 10%; animation-delay: 0s; }
-        .heart-2 { top: 20%; right: 15%; animation-delay: 2s; }
-        .heart-3 { bottom: 30%; left: 20%; animation-delay: 4s; }
-        .heart-4 { bottom: 20%; right: 10%; animation-delay: 1s; }
-
-        .why-title {
-            text-align: center;
-            font-size: 3.2rem;
-            font-weight: bold;
-            margin-top: 2.5rem;
-            margin-bottom: 1.2rem;
-            background: linear-gradient(90deg, #06b6d4 10%, #8b5cf6 60%, #f472b6 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            letter-spacing: 2px;
-            text-shadow: 0 2px 12px rgba(139,92,246,0.15);
-        }
-        .why-desc {
-            text-align: left; /* <-- changed from center to left */
-            font-size: 1.15rem;
-            font-weight: 500;
-            margin: 0 auto 2.5rem auto;
-            max-width: 600px;
-            background: linear-gradient(90deg, #06b6d4 10%, #8b5cf6 60%, #f472b6 100%);
-            -webkit-background-clip: text;
-            -webkit-text-fill-color: transparent;
-            background-clip: text;
-            letter-spacing: 1px;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    use_style("page", WHY_CSS)
 
     # Beautiful Title
     st.markdown('<div class="why-title">WHY I MADE YOU</div>', unsafe_allow_html=True)
@@ -82,17 +84,14 @@ def show_why_i_made_you_screen():
 
     with col1:
         if st.button("🏠 Go to Home", key="blog_home"):
-            st.session_state.selected_day = None
-            st.rerun()
+            go_to_day(None)
 
     with col2:
         if st.button("🔄 Restart Journey", key="blog_restart"):
-            st.session_state.selected_day = 1
-            st.rerun()
+            go_to_day(1)
 
     with col3:
         if st.button("← Back", key="blog_back"):
-            st.session_state.selected_day = 14
-            st.rerun()
+            go_to_day(14)
 
     st.markdown('</div>', unsafe_allow_html=True)
\ No newline at end of file
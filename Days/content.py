@@ -0,0 +1,1857 @@
+from Days.spec import DaySpec, Palette, Prompt
+from soundscape import Soundscape
+
+# The fourteen days of the journey. Days.engine renders every one of them;
+# only the words, timings and colours below differ from day to day.
+
+DAY1 = DaySpec(
+    day=1,
+    icon="🌙",
+    palette=Palette(
+        title="#f472b6",
+        subtitle="#b19cd9",
+        accent="#00ffff",
+        hover="#ff00ff",
+        hover_glow="255, 0, 255",
+        focus_glow="255, 0, 255",
+        quote_from="#ff00ff",
+        quote_to="#00ffff",
+    ),
+    intro_html=(
+        """
+        <div class="day1-header">
+            <h1 class="day1-title">Day 1 🌟</h1>
+            <p class="day1-subtitle">Self-Discovery Begins</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #00ffff; font-size: 1.2rem;">
+                <strong>Welcome to Day 1  🧘‍♀️</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today we'll explore the power of stillness and honest self-reflection. 
+                Take your time with each task and be gentle with yourself.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘 Task 1: 5-Minute Stillness Practice
+            </div>
+            <div class="task-instruction">
+                Find a quiet place, sit comfortably, close your eyes, and do nothing for the next 5 minutes. 
+                Let your mind reveal what it wants. Don't force anything – just be present.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🎯 Start Task 1 (5-Minute Timer)",
+    start_key="start_task1_Day1",
+    duration=300,
+    music_message="🎵 Ambient music started. Relax and enjoy the silence.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'relax.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.3, noise_cutoff=2000.0, drone=(110.0, 165.0), drone_level=0.2, seed=1),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "Sometimes the answers come in silence." 🌙
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: Things I Dislike and Why",
+            label="Your Honest Reflection:",
+            placeholder="1. I dislike... because...\n2. I dislike... because...\n3. I dislike... because...",
+            key="reflection_input_day1",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: Write What You Dislike – And Why
+                    </div>
+                    <div class="task-instruction">
+                        List 3 things you genuinely dislike and explain why. Don't worry about judgment — 
+                        be honest with yourself. This exercise helps you understand your values and boundaries.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💫 Submit My Reflection",
+    submit_key="submit_task2",
+    saved_message="✅ Reflection saved successfully!",
+    missing_warning="⚠️ Please write your reflection before submitting.",
+    thinking_message="AI is thinking...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your reflection has been saved.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 1! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've taken the first step on your journey of self-discovery. 
+                Tomorrow, we'll explore gratitude and its power to transform your perspective.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 1",
+    next_day=2,
+)
+
+DAY2 = DaySpec(
+    day=2,
+    icon="😊",
+    palette=Palette(
+        title="#ffdd00",
+        subtitle="#ffa500",
+        accent="#ffdd00",
+        hover="#ffa500",
+        hover_glow="255, 165, 0",
+        focus_glow="255, 165, 0",
+        quote_from="#ffdd00",
+        quote_to="#ffa500",
+    ),
+    intro_html=(
+        """
+        <div class="day2-header">
+            <h1 class="day2-title">Day 2 😊</h1>
+            <p class="day2-subtitle">What Makes You Smile?</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #ffdd00; font-size: 1.2rem;">
+                <strong>Welcome to Day 2😊</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Let’s pause for a moment and forget the stress. What truly makes you happy?
+                Big or small, silly or serious—every little spark matters. ✨
+                Ready to rediscover those tiny joys that light you up inside?
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Smile Meditation
+            </div>
+            <div class="task-instruction">
+                Sit in silence for 3 minutes. Gently close your eyes and bring to mind the <strong>last moment you genuinely smiled.</strong> 
+                Who were you with? What were you doing? Just <strong>feel that moment</strong> again. Let that warmth fill your heart.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="😊 Start Task 1 (3-Minute Smile Meditation)",
+    start_key="start_task1_day2",
+    duration=180,
+    music_message="🎵 Gentle piano music started. Close your eyes and smile from within.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'piano.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.15, drone=(130.8,), drone_level=0.1, chimes=(261.6, 329.6, 392.0, 523.3), chime_rate=0.7, chime_level=0.35, chime_partials=(1.0, 2.0, 3.0, 4.0), chime_decay=1.2, seed=2),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "A smile is the universal language of kindness." 😊✨
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: What Makes You Genuinely Smile",
+            label="What Makes You Smile:",
+            placeholder="1. _____ makes me smile because...\n2. _____ brings me joy because...\n3. _____ lights up my heart because...",
+            key="reflection_input_day2",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: What Makes You Genuinely Smile?
+                    </div>
+                    <div class="task-instruction">
+                        Think of 3 things—big or small—that bring you genuine joy.
+                        It could be your favorite person, a cozy corner in your home, a song, or a memory that always warms you up inside. Write down why they bring you joy and what they mean to you. Sometimes the smallest things hold the most warmth. 💛
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💛 Submit My Smile Reflection",
+    submit_key="submit_task2_day2",
+    saved_message="✅ Your smile reflection has been saved!",
+    missing_warning="⚠️ Please write your reflection before submitting.",
+    thinking_message="AI is reflecting on your joy...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your smile reflection has been saved.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 2! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've connected with your inner joy and discovered what truly makes you smile. 
+                Tomorrow, we'll explore another dimension of your beautiful self.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 2",
+    next_day=3,
+)
+
+DAY3 = DaySpec(
+    day=3,
+    icon="🌑",
+    palette=Palette(
+        title="#8b5cf6",
+        subtitle="#a78bfa",
+        accent="#8b5cf6",
+        hover="#a78bfa",
+        hover_glow="139, 92, 246",
+        focus_glow="167, 139, 250",
+        quote_from="#8b5cf6",
+        quote_to="#a78bfa",
+    ),
+    extra_css="""
+        .fear-warning {
+            background: rgba(139, 92, 246, 0.2);
+            border: 2px solid #8b5cf6;
+            border-radius: 10px;
+            padding: 1rem;
+            color: #a78bfa;
+            font-weight: bold;
+            margin: 1rem 0;
+            text-align: center;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day3-header">
+            <h1 class="day3-title">Day 3 🌑</h1>
+            <p class="day3-subtitle">Facing Your Fears</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #8b5cf6; font-size: 1.2rem;">
+                <strong>Welcome to Day 3 🌑</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today we explore the shadows within us. Fear is not the enemy — it's a teacher. 
+                By acknowledging what frightens us, we begin to understand ourselves more deeply.
+            </p>
+        </div>
+        """,
+        """
+        <div class="fear-warning">
+            💜 Gentle Reminder: This is a safe space. Go at your own pace and be compassionate with yourself.
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Visualize Your Fear 
+            </div>
+            <div class="task-instruction">
+                Sit in a quiet place. Close your eyes for 5 minutes. Gently ask yourself: 
+                <em>"What is the one fear that has been living in me lately?"</em> 
+                Let the image come naturally — don't force it. Just observe it. Don't fight it.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🌑 Start Task 1 (5-Minute Fear Visualization)",
+    start_key="start_task1_day3",
+    duration=300,
+    music_message="🎵 Ambient sounds started. Breathe deeply and let your awareness expand.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'ambient.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.3, noise_cutoff=3000.0, wind=0.3, drone=(146.8, 220.0, 293.7), drone_level=0.2, seed=3),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "The cave you fear to enter holds the treasure you seek." 🌟
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: What Are You Afraid Of?",
+            label="Your Fear Reflection:",
+            placeholder="I am afraid of... because...\n\nThis fear might have started when...\n\nIt has affected my life by...\n\nWhat I've learned about this fear is...",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: What Are You Afraid Of?
+                    </div>
+                    <div class="task-instruction">
+                        Write about <strong>one thing you fear deeply</strong> — and why. Where did this fear come from? 
+                        How has it affected your choices or thoughts? Be honest and gentle with yourself. 
+                        Remember: naming your fear is the first step to understanding it.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💜 Submit My Fear Reflection",
+    submit_key="submit_task2_day3",
+    saved_message="✅ Your fear reflection has been saved with care.",
+    missing_warning="⚠️ Please write your reflection before submitting.",
+    thinking_message="AI is gently processing your courage...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your fear reflection has been safely stored.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 3! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've shown incredible courage by facing your fears. This act of acknowledgment 
+                is a profound step toward inner freedom. Tomorrow, we'll explore another facet of your journey.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 3",
+    next_day=4,
+)
+
+DAY4 = DaySpec(
+    day=4,
+    icon="🌌",
+    palette=Palette(
+        title="#6366f1",
+        subtitle="#818cf8",
+        accent="#6366f1",
+        hover="#818cf8",
+        hover_glow="99, 102, 241",
+        focus_glow="129, 140, 248",
+        quote_from="#6366f1",
+        quote_to="#818cf8",
+    ),
+    extra_css="""
+        .labels-info {
+            background: rgba(99, 102, 241, 0.2);
+            border: 2px solid #6366f1;
+            border-radius: 10px;
+            padding: 1.5rem;
+            color: #c7d2fe;
+            margin: 1rem 0;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day4-header">
+            <h1 class="day4-title">Day 4 🌌</h1>
+            <p class="day4-subtitle">Who Am I Without the World?</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #6366f1; font-size: 1.2rem;">
+                <strong>Welcome to Day 4 🌌</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today, let’s think about who you are without any roles, labels, or what others expect from you.
+                 Who are you when you let go of everything the world says you should be?
+            </p>
+        </div>
+        """,
+        """
+        <div class="labels-info">
+                <h4 style="color: #6366f1; margin-bottom: 1rem;">💭 What Are "Labels"?</h4>
+                <p style="margin-bottom: 0.5rem;">
+                    Sometimes, we wear so many labels that we forget who we are without them.
+                <p style="margin-bottom: 0.5rem;">
+                    "I'm a teacher," "I'm someone's partner," "I'm the responsible one," "I'm shy," "I'm successful."
+                </p>
+                <p style="margin-bottom: 0;">
+                    But are these truly you, or just roles you've learned to play?
+
+        In The Art of Being Alone, we’re reminded that real self-connection begins when we stop defining ourselves by the outside world.
+        When you're not someone’s friend, daughter, partner, or student—who are you, really?
+                </p>
+            </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Silence the Noise
+            </div>
+            <div class="task-instruction">
+                Sit quietly and imagine a world where <strong>no one knows your name, age, status, or role</strong>. 
+                You're just... you. Who are you when you're not trying to be someone? 
+                Just sit with this feeling. Let the silence reveal your true self.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🌌 Start Task 1 (4-Minute Identity Meditation)",
+    start_key="start_task1_day4",
+    duration=240,
+    music_message="🎵 Deep space ambient sounds started. Float beyond all definitions.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'deepspace.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.35, noise_cutoff=800.0, wind=0.4, drone=(55.0, 82.5, 110.0), drone_level=0.25, seed=4),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "You are not who you think you are. You are not who others think you are. You are who you think others think you are. But who are you really?" 🌟
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: Who Am I Without Labels?",
+            label="Who Am I Beyond Labels:",
+            placeholder="I am... (without using name, job, age, gender, or social roles)\n\nAt my core, I feel like...\n\nWhen no one is watching, I am...\n\nThe essence of who I am is...\n\nWhat remains when all labels are stripped away is...",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: Who Am I Without Labels?
+                    </div>
+                    <div class="task-instruction">
+                        <strong>Without using your name, job, gender, age, or any social role...</strong> describe yourself. 
+                        What remains when you remove every label the world gave you? Write about your essence, 
+                        your core being, the "you" that exists beyond all definitions.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="🌟 Submit My Essence Reflection",
+    submit_key="submit_task2_day4",
+    saved_message="✅ Your essence reflection has been captured.",
+    missing_warning="⚠️ Please write your reflection before submitting.",
+    thinking_message="AI is contemplating your true self...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your essence has been honored and preserved.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 4! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've glimpsed your true self beyond all worldly definitions. This is profound work — 
+                you've connected with your essence, the part of you that exists independent of external validation. 
+                Tomorrow, we'll continue this journey of self-discovery.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 4",
+    next_day=5,
+)
+
+DAY5 = DaySpec(
+    day=5,
+    icon="🏠",
+    palette=Palette(
+        title="#f59e0b",
+        subtitle="#fbbf24",
+        accent="#f59e0b",
+        hover="#fbbf24",
+        hover_glow="245, 158, 11",
+        focus_glow="251, 191, 36",
+        quote_from="#f59e0b",
+        quote_to="#fbbf24",
+    ),
+    extra_css="""
+        .safe-space-info {
+            background: rgba(245, 158, 11, 0.2);
+            border: 2px solid #f59e0b;
+            border-radius: 10px;
+            padding: 1.5rem;
+            color: #fed7aa;
+            margin: 1rem 0;
+        }
+
+        .safe-space-elements {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 1rem;
+            margin: 1rem 0;
+        }
+
+        .element-card {
+            background: rgba(245, 158, 11, 0.1);
+            border: 1px solid #f59e0b;
+            border-radius: 8px;
+            padding: 1rem;
+            text-align: center;
+            color: #fbbf24;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day5-header">
+            <h1 class="day5-title">Day 5 🏠</h1>
+            <p class="day5-subtitle">The Safe Space Within</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #f59e0b; font-size: 1.2rem;">
+                <strong>Welcome to Day 5 🏠</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today, let’s build a safe space in your mind—a peaceful place you can return to whenever the world feels heavy. It’s your own little escape,
+                 created by you, just for you. A space where you can breathe, rest, and simply be. 🕊️
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Guided Imagination 
+            </div>
+            <div class="task-instruction">
+                Close your eyes and imagine a room where you feel <strong>absolutely safe, warm, and calm</strong>. 
+                This is YOUR space—no one can enter without permission. Decorate it however you like. 
+                What colors surround you? What lighting creates the perfect mood? What scents fill the air? 
+                What sounds bring you peace? Make it as detailed as possible.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🏠 Start Task 1 (5-Minute Safe Space Meditation)",
+    start_key="start_task1_day5",
+    duration=300,
+    music_message="🎵 Fireplace and rain sounds started. Begin building your sanctuary.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'fireplace_rain.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.35, noise_cutoff=6000.0, crackle_rate=6.0, crackle_level=0.3, seed=5),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "Within you lies a sanctuary that no storm can touch, no chaos can disturb. You have built your refuge—now you can return to it anytime." 🏡
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: My Mental Safe Space",
+            label="My Mental Safe Space:",
+            placeholder="My safe space looks like...\n\nThe colors and lighting are...\n\nThe sounds I hear are...\n\nThe scents that fill the air are...\n\nWhat makes this space feel safe is...\n\nWhen life gets overwhelming, I would...\n\nThe most comforting feature of my space is...\n\nI feel safe here because...",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: Describe Your Mental Safe Space
+                    </div>
+                    <div class="task-instruction">
+                        Write a detailed description of your <strong>mental safe space</strong>. What does it look like? 
+                        What makes it feel safe and comfortable? What would you do there when life gets overwhelming? 
+                        Include all the sensory details—colors, textures, sounds, scents, lighting.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="🏡 Submit My Safe Space Description",
+    submit_key="submit_task2_day5",
+    saved_message="✅ Your safe space description has been saved.",
+    missing_warning="⚠️ Please describe your safe space before submitting.",
+    thinking_message="AI is blessing your sanctuary...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your sanctuary is now complete and ready for you.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 5! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've created a mental refuge that will always be available to you. This safe space is now part of your 
+                inner toolkit—whenever you feel stressed, anxious, or overwhelmed, you can close your eyes and return to 
+                this sanctuary you've built. Remember every detail, and visit it often.
+            </p>
+        </div>
+        """,
+        """
+        <div class="safe-space-info">
+            <h4 style="color: #f59e0b; margin-bottom: 1rem;">🔑 How to Use Your Safe Space</h4>
+            <p style="margin-bottom: 0.5rem;">• Close your eyes and take 3 deep breaths</p>
+            <p style="margin-bottom: 0.5rem;">• Visualize walking into your safe space</p>
+            <p style="margin-bottom: 0.5rem;">• Engage all your senses—see, hear, smell, feel everything</p>
+            <p style="margin-bottom: 0.5rem;">• Stay for 2-5 minutes or as long as needed</p>
+            <p style="margin-bottom: 0;">• Use this technique whenever you need instant calm</p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 5",
+    next_day=6,
+)
+
+DAY6 = DaySpec(
+    day=6,
+    icon="🔄",
+    palette=Palette(
+        title="#8b5cf6",
+        subtitle="#a78bfa",
+        accent="#8b5cf6",
+        hover="#a78bfa",
+        hover_glow="139, 92, 246",
+        focus_glow="167, 139, 250",
+        quote_from="#8b5cf6",
+        quote_to="#a78bfa",
+    ),
+    intro_html=(
+        """
+        <div class="day6-header">
+            <h1 class="day6-title">Day 6 🔄</h1>
+            <p class="day6-subtitle">Patterns That Define You</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+                <div style="text-align: center; color: #8b5cf6; font-size: 1.2rem;">
+                    <strong>Welcome to Day 6 🔄</strong>
+                </div>
+                <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                    Today, let’s take a closer look at the routines and patterns that guide your life.
+        Each habit—big or small—is shaping the person you’re becoming.
+        Are these habits helping you grow into your best self, or holding you back?
+        It’s time to notice the loops you’re stuck in… and gently choose better ones. 🌱
+                </p>
+            </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Observe Your Daily Patterns 
+            </div>
+            <div class="task-instruction">
+                Sit quietly and mentally walk through your average day — from the moment you wake up to sleep. 
+                Notice what you do <strong>out of routine, without questioning</strong>. What parts feel automatic? 
+                Which moments do you actually feel present in? Observe without judgment, just awareness.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🔄 Start Task 1 (5-Minute Pattern Observation)",
+    start_key="start_task1_day6",
+    duration=300,
+    music_message="🎵 Ticking clock and ambient tones started. Begin observing your patterns.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'ticking_clock_ambient.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.15, drone=(196.0, 293.7), drone_level=0.15, tick_rate=1.0, tick_level=0.3, seed=6),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "We are what we repeatedly do. Excellence, then, is not an act, but a habit. You've just observed the blueprint of your life." 🔄
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: My Daily Loop",
+            label="My Daily Loop Analysis:",
+            placeholder="My 3 daily habits without fail:\n1. \n2. \n3. \n\nWhy I think I formed these habits:\n\nWhich habits serve me:\n\nWhich habits hold me back:\n\nThe one habit I would change if I could:\n\nHow this habit change would improve my life:",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: My Daily Loop
+                    </div>
+                    <div class="task-instruction">
+                        What are <strong>3 habits you follow every day — without fail</strong>? Why do you think you've formed them? 
+                        Do they serve you... or hold you back? Which one would you change if you could?
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="🔄 Submit My Daily Loop Analysis",
+    submit_key="submit_task2_day6",
+    saved_message="✅ Your daily loop analysis has been saved.",
+    missing_warning="⚠️ Please analyze your daily patterns before submitting.",
+    thinking_message="AI is analyzing your patterns...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your pattern awareness is now crystal clear.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 6! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've gained profound awareness of the patterns that shape your daily life. This consciousness is the first step 
+                toward intentional change. Your habits are the compound interest of self-improvement — small changes today 
+                create extraordinary results tomorrow. You now have the power to choose your patterns consciously.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🔄 Reset Day 6",
+    next_day=7,
+)
+
+DAY7 = DaySpec(
+    day=7,
+    icon="💡",
+    palette=Palette(
+        title="#10b981",
+        subtitle="#34d399",
+        accent="#10b981",
+        hover="#34d399",
+        hover_glow="16, 185, 129",
+        focus_glow="52, 211, 153",
+        quote_from="#10b981",
+        quote_to="#34d399",
+    ),
+    intro_html=(
+        """
+        <div class="day7-header">
+            <h1 class="day7-title">Day 7 💡</h1>
+            <p class="day7-subtitle">The Relationship Mirror</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #10b981; font-size: 1.2rem;">
+                <strong>Welcome to Day 7 💡</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                The people around you say a lot about you. They reflect your thoughts, your energy, and even how you see yourself.
+                 Ever notice how some people lift you up and others drain you? Today, take a moment to think about what your relationships are showing you about you.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Relationship Reflection
+            </div>
+            <div class="task-instruction">
+                Close your eyes. Think of one person you interact with often. Now observe: how does your body feel 
+                when you think of them? Heavy? Light? Safe? Nervous? Let these emotions speak. 
+                <strong>Notice the physical sensations</strong> — your body knows the truth about every relationship.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="💡 Start Task 1 (5-Minute Relationship Reflection)",
+    start_key="start_task1_day7",
+    duration=300,
+    music_message="🎵 Wind chimes and ambient tones started. Begin reflecting on your relationships.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'wind_chimes_ambient.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.25, noise_cutoff=2500.0, wind=0.6, chimes=(523.3, 659.3, 784.0, 880.0, 1046.5), chime_rate=0.5, chime_level=0.3, chime_decay=2.5, seed=7),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "Your body is the truth detector your mind often ignores. You've just listened to the wisdom of your relationships." 💡
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: People Who Shape Me",
+            label="People Who Shape Me Analysis:",
+            placeholder="Person who lifts my energy:\nName (or initials): \nHow they make me feel: \nWhy I think this happens: \nWhat this teaches me about myself: \n\nPerson who drains my energy:\nName (or initials): \nHow they make me feel: \nWhy I think this happens: \nWhat this teaches me about myself: \n\nHow I can protect my energy while still being kind:\n\nWhat these relationships reveal about my needs and boundaries:",
+            key="reflection_input",
+            height=250,
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: People Who Shape Me
+                    </div>
+                    <div class="task-instruction">
+                        Write about <strong>one person who lifts your energy</strong>, and <strong>one who drains it</strong>. 
+                        Why do you think that happens? How can you protect your energy while still being kind? 
+                        What do these relationships teach you about yourself?
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💡 Submit My Relationship Analysis",
+    submit_key="submit_task2_day7",
+    saved_message="✅ Your relationship analysis has been saved.",
+    missing_warning="⚠️ Please analyze your relationships before submitting.",
+    thinking_message="AI is analyzing your relationship patterns...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your relationship awareness is now crystal clear.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 7! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've gained powerful insights into how relationships shape your energy and well-being. 
+                The people in your life are mirrors, showing you aspects of yourself and your boundaries. 
+                This awareness empowers you to cultivate relationships that nurture your growth while 
+                protecting your energy. You now understand that healthy relationships are not just about 
+                being kind — they're about honoring your own needs and creating space for mutual respect.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="💡 Reset Day 7",
+    next_day=8,
+)
+
+DAY8 = DaySpec(
+    day=8,
+    icon="🌟",
+    palette=Palette(
+        title="#ec4899",
+        subtitle="#f472b6",
+        accent="#ec4899",
+        hover="#f472b6",
+        hover_glow="236, 72, 153",
+        focus_glow="244, 114, 182",
+        quote_from="#ec4899",
+        quote_to="#f472b6",
+    ),
+    intro_html=(
+        """
+        <div class="day8-header">
+            <h1 class="day8-title">Day 8 🌟</h1>
+            <p class="day8-subtitle">A Walk Through Childhood</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #ec4899; font-size: 1.2rem;">
+                <strong>Welcome to Day 8 🌟</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today, we’re taking a soft step back in time — to the little you. Before rules, pressure, or “shoulds,” there was a version of you full of wonder, curiosity, and real joy.
+                 That inner child still lives in you, holding clues to what truly lights you up. Let’s reconnect with that magic today.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Inner Child Visualization 
+            </div>
+            <div class="task-instruction">
+                Sit back, close your eyes. Picture yourself at age 7. Where are you? What are you doing? 
+                What do you love? Can you feel that freedom again — even for a moment? 
+                <strong>Let that child show you what pure joy feels like.</strong> Don't judge, just observe and feel.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🌟 Start Task 1 (4-Minute Inner Child Journey)",
+    start_key="start_task1_day8",
+    duration=240,
+    music_message="🎵 Relaxing ambient music started. Begin your journey back to childhood.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'music_box_lullaby.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.1, chimes=(1046.5, 1174.7, 1318.5, 1568.0, 1760.0), chime_rate=1.5, chime_level=0.3, chime_partials=(1.0, 3.0, 5.2), chime_decay=0.8, seed=8),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "You've just reconnected with the purest version of yourself. That child's dreams are still valid, still waiting to be honored." 🌟
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: Me as a Child",
+            label="Letter to My Inner Child:",
+            placeholder="What I loved doing as a child that I've forgotten:\n\nWhat I needed most back then:\n\nWhat made me feel most alive and free:\n\nThe dreams I had that felt impossible:\n\nDear Little Me,\nI want you to know that...\n\nI'm sorry for...\n\nI promise to...\n\nYou were perfect just as you were because...\n\nWith love,\nYour Grown-Up Self",
+            key="reflection_input",
+            height=280,
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: Me as a Child
+                    </div>
+                    <div class="task-instruction">
+                        What was something you loved doing as a child but haven’t done in ages? What did you crave most back then — love, safety, freedom? Take a moment and write a few kind, gentle words to that little version of you.
+                        They’re still with you, still hoping to be seen and loved. Let them know you haven’t forgotten them.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="🌟 Submit My Letter to My Inner Child",
+    submit_key="submit_task2_day8",
+    saved_message="✅ Your letter to your inner child has been saved.",
+    missing_warning="⚠️ Please write your letter to your inner child before submitting.",
+    thinking_message="AI is reflecting on your childhood connection...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your inner child has been heard and honored.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 8! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've just completed one of the most profound journeys — reconnecting with your inner child. 
+                That little person inside you holds the blueprint of your authentic self, your purest dreams, 
+                and your natural capacity for joy. The loves and needs you discovered today are not childish — 
+                they are the foundation of who you truly are. Honor them, nurture them, and let them guide you 
+                back to the life that feels most genuinely yours.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🌟 Reset Day 8",
+    next_day=9,
+)
+
+DAY9 = DaySpec(
+    day=9,
+    icon="💡",
+    palette=Palette(
+        title="#f59e0b",
+        subtitle="#fbbf24",
+        accent="#f59e0b",
+        hover="#fbbf24",
+        hover_glow="245, 158, 11",
+        focus_glow="251, 191, 36",
+        quote_from="#f59e0b",
+        quote_to="#fbbf24",
+    ),
+    extra_css="""
+        .creativity-icon {
+            font-size: 2rem;
+            margin-right: 0.5rem;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day9-header">
+            <h1 class="day9-title">Day 9 💡</h1>
+            <p class="day9-subtitle">Creativity is Expression</p>
+
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #f59e0b; font-size: 1.2rem;">
+                <strong>Welcome to Day 9💡</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Creativity isn’t just about painting or writing — it’s about expressing what’s deep inside you in your own unique way. Everyone has a creative spark, including you. 
+                Today, give yourself the space to explore it without overthinking. Your ideas, your voice, your way of creating — they matter.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Creative Visualization 
+            </div>
+            <div class="task-instruction">
+                Close your eyes and imagine yourself creating freely — maybe you’re painting, dancing, writing, or just letting your thoughts flow. No pressure, no judgment, just you being fully yourself.
+                 How does it feel? Light? Joyful? Free? Let that feeling sink in. This is your true creative self — confident, expressive, and alive.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="💡 Start Task 1 (5-Minute Creative Journey)",
+    start_key="start_task1_day9",
+    duration=300,
+    music_message="🎵 Soulful piano music started. Begin your creative visualization.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'soulful_piano.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.1, drone=(110.0,), drone_level=0.1, chimes=(220.0, 261.6, 329.6, 392.0), chime_rate=0.6, chime_level=0.35, chime_partials=(1.0, 2.0, 3.0, 4.0), chime_decay=2.5, seed=9),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "You've just connected with your creative essence. That vision of yourself expressing freely is not a dream — it's a possibility waiting to be born." 🎨
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: My Creative Self",
+            label="My Creative Expression Journey:",
+            placeholder="The form of expression I've always wanted to try:\n\nWhat has held me back from trying it:\n\nThe fears or doubts I have about creative expression:\n\nWhat it would mean to finally let myself try:\n\nHow I imagine I would feel when expressing myself freely:\n\nThe message or feeling I want to share through my creativity:\n\nWhat I would tell someone else who's afraid to be creative:\n\nMy commitment to honoring my creative self:",
+            key="reflection_input",
+            height=280,
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: My Creative Self
+                    </div>
+                    <div class="task-instruction">
+                        What’s one creative thing you’ve always wanted to try — maybe painting, singing, or writing — but never gave yourself the chance? What stopped you? Fear? Doubt? Time?
+                         Imagine how it would feel to finally go for it, just for you. Your creativity matters, and the world deserves to see the beauty only you can create.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💡 Submit My Creative Self Reflection",
+    submit_key="submit_task2_day9",
+    saved_message="✅ Your creative self reflection has been saved.",
+    missing_warning="⚠️ Please write your creative self reflection before submitting.",
+    thinking_message="AI is reflecting on your creative journey...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your creative voice has been acknowledged and honored.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 9! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've just taken a profound step toward honoring your creative self. Creativity isn't a luxury — 
+                it's a necessity for the soul. The form of expression you've always wanted to try isn't just a hobby; 
+                it's a calling from your authentic self. Remember: you don't have to be perfect to be creative. 
+                You just have to be brave enough to begin. Your unique creative voice is needed in this world, 
+                and today you've taken the first step toward letting it be heard.
+            </p>
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            <span class="creativity-icon">🎨</span>
+            "Your creativity is not a talent you either have or don't have. It's a birthright waiting to be claimed." 
+            <span class="creativity-icon">🌟</span>
+        </div>
+        """,
+    ),
+    reset_label="💡 Reset Day 9",
+    next_day=10,
+)
+
+DAY10 = DaySpec(
+    day=10,
+    icon="💡",
+    palette=Palette(
+        title="#7c3aed",
+        subtitle="#a855f7",
+        accent="#7c3aed",
+        hover="#a855f7",
+        hover_glow="124, 58, 237",
+        focus_glow="168, 85, 247",
+        quote_from="#7c3aed",
+        quote_to="#a855f7",
+    ),
+    extra_css="""
+        .fear-transformation {
+            background: rgba(124, 58, 237, 0.1);
+            border-left: 4px solid #7c3aed;
+            padding: 1rem;
+            margin: 1rem 0;
+            border-radius: 0 10px 10px 0;
+        }
+
+        .courage-reminder {
+            background: rgba(168, 85, 247, 0.2);
+            border: 1px solid #a855f7;
+            border-radius: 10px;
+            padding: 1rem;
+            margin: 1rem 0;
+            text-align: center;
+            color: #ffffff;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day10-header">
+            <h1 class="day10-title">Day 10 💡</h1>
+            <p class="day10-subtitle">Name the Fear Again</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #7c3aed; font-size: 1.2rem;">
+                <strong>Welcome to Day 10 💡</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today we’re looking at fear again — but in a gentler way. Fear isn’t always bad. It shows up because it’s trying to protect you. Instead of fighting it, try to listen to it.
+                What is it trying to tell you? When you understand your fear, it becomes easier to move past it and feel braver inside.</p>
+        </div>
+        """,
+        """
+        <div class="fear-transformation">
+            <div style="color: #7c3aed; font-weight: bold; margin-bottom: 0.5rem;">
+                💫 Fear Transformation Insight:
+            </div>
+            <p style="color: #ffffff; margin: 0; font-size: 1rem;">
+                Fear often guards our deepest dreams. What you're most afraid of losing or failing at 
+                might be exactly what you're meant to pursue. Today, we listen to fear's message 
+                and gently question its authority over your life.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Fear Revisit Meditation 
+            </div>
+            <div class="task-instruction">
+                Sit in silence. Bring back one fear you named before. Now ask: "What is it protecting me from?" 
+                Breathe into that question. <strong>Don't try to fix or change anything — just listen.</strong> 
+                Let your fear speak. What does it want you to know? What is it trying to keep safe?
+            </div>
+        </div>
+        """,
+    ),
+    start_label="💡 Start Task 1 (4-Minute Fear Meditation)",
+    start_key="start_task1_day10",
+    duration=240,
+    music_message="🎵 Heartbeat and wind sounds started. Begin your fear meditation.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'heartbeat_wind.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.3, noise_cutoff=1500.0, wind=0.7, heartbeat_bpm=60, heartbeat_level=0.5, seed=10),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "You've just had a conversation with your fear. In listening to its message, you've begun to transform your relationship with it from enemy to teacher." 🌟
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: Facing It Gently",
+            label="My Gentle Approach to Fear:",
+            placeholder="The fear I revisited today:\n\nWhat I discovered this fear is protecting:\n\nThe message my fear wanted me to hear:\n\nOne small action I could take to face this fear:\n\nWhat would change in my life if this fear disappeared:\n\nHow I imagine I would feel without this fear:\n\nWhat I would pursue if I were truly fearless:\n\nMy gentle commitment to myself:\n\nWhat support I need to take this small step:",
+            key="reflection_input",
+            height=300,
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: Facing It Gently
+                    </div>
+                    <div class="task-instruction">
+                        What’s one small, simple step you could take to face that fear today? Just a tiny move forward.
+                        Now imagine — how would your life feel if that fear wasn’t holding you back anymore? <strong>Remember, courage doesn’t mean you’re not scared. It means you’re choosing to move forward anyway, even with the fear there.</strong>
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💡 Submit My Fear Transformation Journey",
+    submit_key="submit_task2_day10",
+    saved_message="✅ Your fear transformation journey has been saved.",
+    missing_warning="⚠️ Please write your fear transformation reflection before submitting.",
+    thinking_message="AI is reflecting on your courage journey...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! You've transformed your relationship with fear.
+        </div>
+        """,
+    ),
+    after_task2_html=(
+        """
+        <div class="courage-reminder">
+            <strong>💪 Courage Reminder:</strong><br>
+            “The cave you’re scared to enter might be exactly where your biggest treasure is hiding. Fear isn’t your enemy 
+            — it’s just standing at the door of the growth you’re ready for.”
+
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 10! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've just accomplished something profound — you've transformed your relationship with fear. 
+                Instead of running from it, you listened to its message. Instead of being paralyzed by it, 
+                you've identified a small, gentle step forward. This is how courage is born: not in the absence 
+                of fear, but in the presence of wisdom. The small action you've committed to is not just a step 
+                toward overcoming fear — it's a step toward becoming who you're truly meant to be.
+            </p>
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "What if you were fearless? Today, you've begun to find out. The answer isn't that you'd have no fear — 
+            it's that you'd have a different relationship with it. Welcome to your courage journey." 🦋
+        </div>
+        """,
+    ),
+    reset_label="💡 Reset Day 10",
+    next_day=11,
+)
+
+DAY11 = DaySpec(
+    day=11,
+    icon="💪",
+    palette=Palette(
+        title="#f59e0b",
+        subtitle="#fbbf24",
+        accent="#f59e0b",
+        hover="#fbbf24",
+        hover_glow="245, 158, 11",
+        focus_glow="251, 191, 36",
+        quote_from="#f59e0b",
+        quote_to="#fbbf24",
+    ),
+    intro_html=(
+        """
+        <div class="day11-header">
+            <h1 class="day11-title">Day 11 💪</h1>
+            <p class="day11-subtitle">Know Your Strength</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #f59e0b; font-size: 1.2rem;">
+                <strong>Welcome to Day 11 💪</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today is all about remembering your strength. You’ve made it through tough times,
+             faced challenges, and survived every hard day so far. That’s not small — that’s resilience. Now it’s time to see that power in yourself and own it.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Inner Power Recall 
+            </div>
+            <div class="task-instruction">
+                Close your eyes. Recall one moment in your life where you showed strength. It can be small — 
+                even getting out of bed on a hard day. Feel that strength again. Hold it. Own it. 
+                Let that feeling of resilience fill your entire being.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="💪 Start Task 1 (3-Minute Inner Power Recall)",
+    start_key="start_task1_day11",
+    duration=180,
+    music_message="🎵 Subtle drums and rising tones started. Begin recalling your inner strength.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'drums_rising_tone.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.15, drone=(110.0, 138.6, 164.8), drone_level=0.2, heartbeat_bpm=72, heartbeat_level=0.4, seed=11),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "You are braver than you believe, stronger than you seem, and more capable than you imagine. That strength you just felt? It's always been there." 💪
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: My Quiet Power",
+            label="My Quiet Power Analysis:",
+            placeholder="3 moments where I surprised myself:\n1. \n2. \n3. \n\nWhat these moments say about me:\n\nThe strength I want to build more of:\n\nHow I can tap into this strength when I need it most:\n\nOne way I'll honor my strength moving forward:",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: My Quiet Power
+                    </div>
+                    <div class="task-instruction">
+                        List <strong>3 moments where you surprised yourself</strong> with your resilience or strength. 
+                        What do these moments say about you? What kind of strength do you want to build more of? 
+                        Your quiet power is often your greatest power.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💪 Submit My Quiet Power Analysis",
+    submit_key="submit_task2_day11",
+    saved_message="✅ Your quiet power analysis has been saved.",
+    missing_warning="⚠️ Please analyze your quiet power before submitting.",
+    thinking_message="AI is analyzing your inner strength...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your inner strength is now recognized and honored.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 11! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've reconnected with your inner strength and recognized your resilience. This awareness is your superpower — 
+                knowing that you've overcome challenges before means you can overcome whatever comes next. Your strength isn't 
+                just in the big moments; it's in every small act of courage, every time you choose to keep going. 
+                You are stronger than you think, and now you know it.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="💪 Reset Day 11",
+    next_day=12,
+)
+
+DAY12 = DaySpec(
+    day=12,
+    icon="🧭",
+    palette=Palette(
+        title="#06b6d4",
+        subtitle="#67e8f9",
+        accent="#06b6d4",
+        hover="#67e8f9",
+        hover_glow="6, 182, 212",
+        focus_glow="103, 232, 249",
+        quote_from="#06b6d4",
+        quote_to="#67e8f9",
+    ),
+    intro_html=(
+        """
+        <div class="day12-header">
+            <h1 class="day12-title">Day 12 🧭</h1>
+            <p class="day12-subtitle">The Compass Within</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #06b6d4; font-size: 1.2rem;">
+                <strong>Welcome to Day 12 🧭</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today is about tuning into what really matters to you. In a world full of noise and opinions,
+                your values are like your inner compass — they help you make choices that feel right and real. Let’s take a moment to get clear on what you truly stand for.
+            </p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Value Reflection
+            </div>
+            <div class="task-instruction">
+                Sit quietly. Ask yourself: <strong>"If I could only live by 3 values, what would they be?"</strong> 
+                 Don’t force it — just breathe and listen. Let the answers rise from within, 
+                not from what you think you should value, but from what truly feels right in your heart.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="🧭 Start Task 1 (4-Minute Value Reflection)",
+    start_key="start_task1_day12",
+    duration=240,
+    music_message="🎵 Soft echo and flute sounds started. Begin exploring your core values.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'soft_echo_flute.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.2, noise_cutoff=3000.0, chimes=(440.0, 523.3, 587.3, 659.3), chime_rate=0.3, chime_level=0.25, chime_partials=(1.0, 2.0, 3.0), chime_decay=4.0, seed=12),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "Your values are your compass. They don't change with the weather or the crowd. What you discovered just now? That's your true north." 🧭
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: My Guiding Values",
+            label="My Guiding Values Analysis:",
+            placeholder="My 3 core values are:\n1. \n2. \n3. \n\nHow aligned my current life is with these values:\n\nAreas where I'm living my values well:\n\nAreas where I'm not aligned with my values:\n\nSmall shifts I can make to live more aligned:\n\nOne action I'll take this week to honor my values:",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: My Guiding Values
+                    </div>
+                    <div class="task-instruction">
+                        What are <strong>3 values you wish to live by</strong>? How aligned is your current life with them? 
+                        What small shifts could bring you closer to living these values daily? Your compass is only useful 
+                        if you follow its direction.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="🧭 Submit My Guiding Values Analysis",
+    submit_key="submit_task2_day12",
+    saved_message="✅ Your guiding values analysis has been saved.",
+    missing_warning="⚠️ Please analyze your guiding values before submitting.",
+    thinking_message="AI is analyzing your inner compass...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your inner compass is now calibrated and clear.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 12! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've discovered your inner compass — your core values that guide your path through life. 
+                These aren't just abstract concepts; they're the foundation of authentic living. When you align 
+                your actions with your values, you create a life of meaning and fulfillment. Your compass is now 
+                clear. Trust it. Follow it. Let it guide you toward the life you truly want to live.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="🧭 Reset Day 12",
+    next_day=13,
+)
+
+DAY13 = DaySpec(
+    day=13,
+    icon="✨",
+    palette=Palette(
+        title="#f472b6",
+        subtitle="#fb7185",
+        accent="#f472b6",
+        hover="#fb7185",
+        hover_glow="244, 114, 182",
+        focus_glow="251, 113, 133",
+        quote_from="#f472b6",
+        quote_to="#fb7185",
+    ),
+    extra_css="""
+        .dream-glow {
+            animation: dreamGlow 3s ease-in-out infinite alternate;
+        }
+
+        @keyframes dreamGlow {
+            from { text-shadow: 0 0 20px #f472b6; }
+            to { text-shadow: 0 0 30px #fb7185, 0 0 40px #f472b6; }
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day13-header">
+            <h1 class="day13-title dream-glow">Day 13 ✨</h1>
+            <p class="day13-subtitle">Let the Dream Speak</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #f472b6; font-size: 1.2rem;">
+                <strong>Welcome to Day 13 ✨</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today is about letting your dreams breathe again — with clarity and childlike wonder. Your imagination isn’t just daydreaming;
+                 it’s your soul showing you what’s possible. The dreams you’ve tucked away under fear or doubt? They’re still there, still alive. And today, you gently give them space to come back to life.</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Dream Visualization 
+            </div>
+            <div class="task-instruction">
+                Close your eyes. Imagine your life five years from now — if fear, doubt, or limits didn't exist. 
+                <strong>Where are you? Who's with you?</strong> Let the vision unfold naturally. Don't edit or judge — 
+                just let your heart show you what it truly wants. This is your soul speaking through imagination.
+            </div>
+        </div>
+        """,
+    ),
+    start_label="✨ Start Task 1 (5-Minute Dream Visualization)",
+    start_key="start_task1_day13",
+    duration=300,
+    timer_glow="#fb7185",
+    music_message="🎵 Relaxing music started. Let your dreams unfold.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'sunrise_soft_synth.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="pink", noise_level=0.2, noise_cutoff=2500.0, wind=0.2, drone=(130.8, 196.0, 261.6, 329.6), drone_level=0.25, seed=13),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "Every great dream begins with a dreamer. You have within you the strength, the patience, and the passion to reach for the stars." ✨
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: If Nothing Stopped Me...",
+            label="If Nothing Stopped Me Analysis:",
+            placeholder="The dream I've buried or ignored:\n\nWhy this dream still calls to me:\n\nWhat made me abandon this dream:\n\nWhat it would take to give it a chance again:\n\nOne small step I could take toward this dream:\n\nHow my life would feel different if I pursued this dream:\n\nWhat I want to tell my younger self about dreams:",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: If Nothing Stopped Me...
+                    </div>
+                    <div class="task-instruction">
+                        What is <strong>one dream you've buried or ignored</strong>? Why does it still call to you? 
+                        What would it take to give it a chance again? Sometimes the dreams we've abandoned are the ones 
+                        our souls need most. It's time to excavate them with love and curiosity.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="✨ Submit My Dream Analysis",
+    submit_key="submit_task2_day13",
+    saved_message="✅ Your dream analysis has been saved.",
+    missing_warning="⚠️ Please explore your dreams before submitting.",
+    thinking_message="AI is exploring your dreams...",
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! Your dreams are no longer buried — they're alive and ready to grow.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="task-card" style="border-color: #00ff00;">
+            <div style="text-align: center; color: #00ff00; font-size: 1.5rem;">
+                🎉 Congratulations! You've completed Day 13! 🎉
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center;">
+                You've reconnected with your dreams and given them permission to speak again. Your imagination has shown you 
+                what's possible when fear and doubt step aside. These aren't just fantasies — they're glimpses of your 
+                potential future. The dream you explored today is a seed. With attention, courage, and small daily actions, 
+                seeds become forests. Your dreams are valid. Your dreams are possible. Your dreams are calling.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="✨ Reset Day 13",
+    next_day=14,
+)
+
+DAY14 = DaySpec(
+    day=14,
+    icon="💡",
+    palette=Palette(
+        title="#8b5cf6",
+        subtitle="#a78bfa",
+        accent="#8b5cf6",
+        hover="#a78bfa",
+        hover_glow="139, 92, 246",
+        focus_glow="167, 139, 250",
+        quote_from="#8b5cf6",
+        quote_to="#a78bfa",
+    ),
+    extra_css="""
+        .final-completion {
+            background: linear-gradient(135deg, #8b5cf6, #a78bfa, #8b5cf6);
+            border: 3px solid #8b5cf6;
+            border-radius: 15px;
+            padding: 2rem;
+            margin: 2rem 0;
+            text-align: center;
+            color: white;
+            font-size: 1.3rem;
+            font-weight: bold;
+            box-shadow: 0 0 30px rgba(139, 92, 246, 0.5);
+        }
+
+        .integration-glow {
+            animation: integrationGlow 3s ease-in-out infinite alternate;
+        }
+
+        @keyframes integrationGlow {
+            from { text-shadow: 0 0 20px #8b5cf6; }
+            to { text-shadow: 0 0 30px #a78bfa, 0 0 40px #8b5cf6; }
+        }
+
+        .journey-summary {
+            background: rgba(139, 92, 246, 0.1);
+            border: 2px solid #8b5cf6;
+            border-radius: 15px;
+            padding: 1.5rem;
+            margin: 2rem 0;
+            color: #ffffff;
+            font-size: 1.1rem;
+            line-height: 1.6;
+        }
+        """,
+    intro_html=(
+        """
+        <div class="day14-header">
+            <h1 class="day14-title integration-glow">Day 14 💡</h1>
+            <p class="day14-subtitle">Becoming Whole Again</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div style="text-align: center; color: #8b5cf6; font-size: 1.2rem;">
+                <strong>Welcome to Day 14💡</strong>
+            </div>
+            <p style="color: #ffffff; margin-top: 1rem; text-align: center; font-size: 1.1rem;">
+                Today is about bringing it all together — every insight, every feeling from the past 13 days.
+                 It’s a gentle reminder that you don’t have to be perfect to be whole. Your joy, fear, strength, messiness, and softness all belong. Today, you simply accept all of you, with love.</p>
+        </div>
+        """,
+        """
+        <div class="journey-summary">
+            <h3 style="color: #8b5cf6; text-align: center; margin-bottom: 1rem;">🌟 Your 14-Day Journey</h3>
+            <p>You’ve explored every part of yourself — your thoughts, fears, dreams, and strengths. Each day peeled back another layer, revealing more of who you truly are.
+             Today is about owning it all. Every piece, every experience, every part of you belongs. This is your full, powerful self — not perfect, but real and complete.</p>
+        </div>
+        """,
+        """
+        <div class="task-card">
+            <div class="task-header">
+                🧘‍♀️ Task 1: Whole Self Meditation
+            </div>
+            <div class="task-instruction">
+                Close your eyes. Imagine yourself walking through each day of this journey. You meet all your past selves — 
+                the one who's afraid, the one who smiles, the one who hides, and the one who dreams. Stand in front of them 
+                and say: <strong>"You are all me — and I accept you."</strong> Feel a gentle light wrap around you, 
+                holding all your pieces together in peace.
+            </div>
+        </div>S
+        """,
+    ),
+    start_label="💡 Start Task 1 (6-Minute Whole Self Meditation)",
+    start_key="start_task1_day14",
+    duration=360,
+    timer_glow="#a78bfa",
+    music_message="🎵 Soft ambient glow with heartbeat and wind started. Let integration begin.",
+    music_hint="🎵 Music file not found. Create a 'music' folder and add 'ambient_glow_heartbeat_wind.mp3' for ambient sounds.",
+    soundscape=Soundscape(noise="brown", noise_level=0.3, noise_cutoff=1500.0, wind=0.6, drone=(174.6, 261.6), drone_level=0.15, heartbeat_bpm=56, heartbeat_level=0.4, seed=14),
+    task1_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 1 Completed!
+        </div>
+        """,
+        """
+        <div class="motivational-quote">
+            "The curious paradox is that when I accept myself just as I am, then I can change." - Carl Rogers 💫
+        </div>
+        """,
+    ),
+    prompts=(
+        Prompt(
+            task="Task 2: What Have I Learned About Myself?",
+            label="What Have I Learned About Myself:",
+            placeholder="What surprised me most during this journey:\n\nOne belief about myself that changed:\n\nA part of me I reconnected with:\n\nThe biggest insight I gained:\n\nHow I see myself differently now:\n\nWhat I'm most grateful for from this journey:\n\nA strength I discovered in myself:",
+            key="reflection_input",
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        ✍️ Task 2: What Have I Learned About Myself?
+                    </div>
+                    <div class="task-instruction">
+                        Look back. What surprised you most during this journey? What is one belief about yourself that changed? 
+                        What part of you did you reconnect with? Take time to honor the insights you've gained and the 
+                        growth you've experienced.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+        Prompt(
+            task="Final Reflection: From this journey, I carry forward...",
+            label="From this journey, I carry forward...",
+            placeholder="From this journey, I carry forward...\n\n(Write whatever flows from your heart - your intentions, commitments, hopes, or newfound wisdom)",
+            key="final_reflection_input",
+            height=150,
+            intro_html=(
+                """
+                <div class="task-card">
+                    <div class="task-header">
+                        🌱 Final Reflection Bonus
+                    </div>
+                    <div class="task-instruction">
+                        Complete this sentence: <strong>"From this journey, I carry forward..."</strong><br>
+                        Write whatever flows from your heart. This is your commitment to yourself and your growth.
+                    </div>
+                </div>
+                """,
+            ),
+        ),
+    ),
+    submit_label="💡 Submit My Integration Reflection",
+    submit_key="submit_task2_day14",
+    saved_message="✅ Your integration reflection has been saved.",
+    missing_warning="⚠️ Please complete both reflections before submitting.",
+    thinking_message="AI is celebrating your journey...",
+    feedback_template="Journey Learning: {}\n\nCarrying Forward: {}",
+    show_history=True,
+    task2_done_html=(
+        """
+        <div class="completion-message">
+            ✅ Task 2 Completed! You've integrated your journey beautifully.
+        </div>
+        """,
+    ),
+    day_done_html=(
+        """
+        <div class="final-completion">
+            <h2>🎉 CONGRATULATIONS! 🎉</h2>
+            <h3>You've completed your 14-Day SoulScanner Journey!</h3>
+            <p style="margin-top: 1.5rem; font-size: 1.1rem;">
+                You've traveled through the depths of yourself with courage and curiosity. You've met your fears, 
+                embraced your strengths, uncovered your dreams, and integrated all parts of yourself with love. 
+                This isn't the end — it's the beginning of living as your whole, authentic self.
+            </p>
+            <p style="margin-top: 1rem; font-size: 1rem;">
+                <strong>You are whole. You are enough. You are ready.</strong>
+            </p>
+            <p style="margin-top: 1rem; font-size: 0.9rem; font-style: italic;">
+                The journey continues in how you choose to live each day. Carry this wisdom forward. 💫
+            </p>
+        </div>
+        """,
+        """
+        <div class="journey-summary">
+            <h4 style="color: #8b5cf6; text-align: center;">🌟 Your Journey's Wisdom</h4>
+            <p style="text-align: center; font-style: italic;">
+                "The privilege of a lifetime is being who you are." - Joseph Campbell
+            </p>
+            <p style="text-align: center; margin-top: 1rem;">
+                You've claimed this privilege. You've become who you are, fully and beautifully. 
+                Take this wholeness into the world — it's your gift to yourself and others.
+            </p>
+        </div>
+        """,
+    ),
+    reset_label="💡 Reset Day 14",
+    next_label="🔄 Restart Journey",
+    next_key="restart_journey",
+    next_day=1,
+)
+
+DAYS = {spec.day: spec for spec in (
+    DAY1,
+    DAY2,
+    DAY3,
+    DAY4,
+    DAY5,
+    DAY6,
+    DAY7,
+    DAY8,
+    DAY9,
+    DAY10,
+    DAY11,
+    DAY12,
+    DAY13,
+    DAY14,
+)}
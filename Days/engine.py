@@ -0,0 +1,359 @@
+import streamlit as st
+import time
+import html
+from string import Template
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from utils import FEEDBACK_POLL_INTERVAL, submit_groq_feedback, show_ai_feedback
+from timer import countdown_timer
+from storage import reflection_store, reflection_writer
+from theme import use_style
+from journey import TASK1, TASK2, checkpoint_journey, current_journey
+from audio import ambient_track_url
+from soundscape import soundscape_url
+from Days.content import DAYS
+from Days.registry import go_to_day
+
+# Styling shared by every day; the $names come from the day's Palette
+DAY_CSS = Template("""
+    /* Day $day specific styling */
+    .day$day-container {
+        max-width: 800px;
+        margin: 0 auto;
+        padding: 2rem;
+    }
+
+    .day$day-header {
+        text-align: center;
+        margin-bottom: 3rem;
+    }
+
+    .day$day-title {
+        font-size: 3rem;
+        font-weight: bold;
+        color: $title;
+        text-shadow: 0 0 20px $title;
+        margin-bottom: 1rem;
+    }
+
+    .day$day-subtitle {
+        font-size: 1.3rem;
+        color: $subtitle;
+        font-style: italic;
+    }
+
+    .task-card {
+        background: rgba(255, 255, 255, 0.1);
+        border: 2px solid $accent;
+        border-radius: 15px;
+        padding: 2rem;
+        margin: 2rem 0;
+        backdrop-filter: blur(10px);
+        transition: all 0.3s ease;
+    }
+
+    .task-card:hover {
+        border-color: $hover;
+        box-shadow: 0 8px 25px rgba($hover_glow, 0.3);
+    }
+
+    .task-header {
+        color: $accent;
+        font-size: 1.5rem;
+        font-weight: bold;
+        margin-bottom: 1rem;
+        display: flex;
+        align-items: center;
+        gap: 10px;
+    }
+
+    .task-instruction {
+        color: #ffffff;
+        font-size: 1.1rem;
+        line-height: 1.6;
+        margin-bottom: 1.5rem;
+    }
+
+    .timer-display {
+        font-size: 4rem;
+        font-weight: bold;
+        color: $accent;
+        text-align: center;
+        margin: 2rem 0;
+        text-shadow: 0 0 20px $accent;
+    }
+
+    .motivational-quote {
+        background: linear-gradient(135deg, $quote_from, $quote_to);
+        border-radius: 10px;
+        padding: 1.5rem;
+        margin: 2rem 0;
+        text-align: center;
+        color: white;
+        font-size: 1.2rem;
+        font-style: italic;
+        font-weight: bold;
+    }
+
+    .completion-message {
+        background: rgba(0, 255, 0, 0.2);
+        border: 2px solid #00ff00;
+        border-radius: 10px;
+        padding: 1rem;
+        color: #00ff00;
+        font-weight: bold;
+        margin: 1rem 0;
+        text-align: center;
+    }
+
+    .stTextArea textarea {
+        background-color: rgba(255, 255, 255, 0.1);
+        border: 2px solid $accent;
+        border-radius: 10px;
+        color: #000000;
+        font-size: 1rem;
+        backdrop-filter: blur(10px);
+    }
+
+    .stTextArea textarea:focus {
+        border-color: $hover;
+        box-shadow: 0 0 15px rgba($focus_glow, 0.5);
+    }
+""")
+
+def day_css(spec):
+    """Build a day's stylesheet from its palette and extra rules"""
+    css = DAY_CSS.substitute(vars(spec.palette), day=spec.day)
+    if spec.extra_css:
+        css += "\n\n" + spec.extra_css
+    return css
+
+def save_reflection(spec, texts):
+    """Queue a reflection for the shared store; returns the write's acknowledgment, or None"""
+    try:
+        # All of a day's answers land in one batch, so they are committed together,
+        # by the background writer rather than while the page waits
+        journey = current_journey()
+        return reflection_writer.submit([
+            (spec.day, journey.journey_id, journey.user_name, prompt.task, text)
+            for prompt, text in zip(spec.prompts, texts)
+        ])
+    except Exception as e:
+        st.error(f"Error saving reflection: {str(e)}")
+        return None
+
+def day_ambient_url(spec):
+    """URL of the day's ambient loop: its synthesized soundscape, else music/relax.mp3"""
+    if spec.soundscape is not None:
+        url = soundscape_url(spec.soundscape)
+        if url:
+            return url
+    return ambient_track_url()
+
+def play_ambient_music(spec):
+    """Check the ambient music is available; the browser plays it alongside the timer"""
+    try:
+        # The first start of a day renders its soundscape; later ones reuse the file
+        if day_ambient_url(spec):
+            return True
+        st.warning(spec.music_hint)
+        return False
+    except Exception as e:
+        st.error(f"Error playing music: {str(e)}")
+        return False
+
+def show_html(blocks):
+    for block in blocks:
+        st.markdown(block, unsafe_allow_html=True)
+
+def show_journey_history(day):
+    """Show the user's answers from the days before this one"""
+    # Earlier answers from this journey only, read from the per-journey index
+    journey_history = reflection_store.journey_history(current_journey().journey_id)
+    earlier_days = [earlier for earlier in sorted(journey_history) if earlier < day]
+    if earlier_days:
+        with st.expander("📜 Look back at what you wrote on earlier days"):
+            for earlier in earlier_days:
+                for entry in journey_history[earlier]:
+                    st.markdown(f"""
+                    <div class="journey-summary">
+                        <strong>Day {earlier} · {html.escape(entry["task"])}</strong><br>
+                        {html.escape(entry["text"]).replace(chr(10), "<br>")}
+                    </div>
+                    """, unsafe_allow_html=True)
+
+def rerun_panel():
+    """Re-run only the current panel when it is running on its own, else the whole page"""
+    ctx = get_script_run_ctx()
+    # A widget inside a fragment re-runs just that fragment; Streamlit refuses
+    # scope="fragment" when the same code is reached during a full run
+    if ctx is not None and ctx.fragment_ids_this_run:
+        st.rerun(scope="fragment")
+    st.rerun()
+
+@st.fragment
+def show_timer_panel(spec):
+    """Task 1 timer; its buttons re-run only this panel"""
+    journey = current_journey()
+    day = spec.day
+    
+    # Timer logic
+    if journey.timer_start(day) is None and not journey.completed(day, TASK1):
+        if st.button(spec.start_label, key=spec.start_key):
+            journey.start_timer(day, time.time())
+            if play_ambient_music(spec):
+                st.success(spec.music_message)
+            rerun_panel()
+    
+    # Show timer if running
+    if journey.timer_start(day) is not None:
+        # The countdown ticks in the browser and only reports back when it finishes
+        finished = countdown_timer(
+            spec.duration,
+            journey.timer_start(day),
+            color=spec.palette.accent,
+            glow=spec.timer_glow,
+            # Looped in the browser until the countdown ends or the timer goes away
+            audio=day_ambient_url(spec),
+            key=f"timer_day{spec.day}",
+        )
+        if not finished:
+            # Stop Timer Button
+            if st.button("⏹️ Stop Timer", key="stop_task1"):
+                journey.stop_timer(day)
+                st.success("⏹️ Timer stopped.")
+                rerun_panel()
+        else:
+            # Timer completed; the whole page re-runs once, since the day's
+            # completion message further down depends on it
+            journey.stop_timer(day)
+            journey.complete(day, TASK1)
+            st.rerun()
+    
+    # Show completion message for Task 1
+    if journey.completed(day, TASK1):
+        show_html(spec.task1_done_html)
+    
+    # A run of just this panel never reaches the checkpoint at the end of app.py
+    checkpoint_journey()
+
+@st.fragment(run_every=FEEDBACK_POLL_INTERVAL)
+def _poll_pending_save(ack):
+    """Re-run only this slot until the reflection's write is acknowledged"""
+    if ack.done():
+        # One full rerun marks the task done, or reports the failure
+        st.rerun()
+    st.info("💾 Saving your reflection...")
+
+@st.fragment
+def show_reflection_panel(spec):
+    """Task 2 text areas, submit, feedback and completion cards; typing re-runs only this panel"""
+    journey = current_journey()
+    day = spec.day
+    
+    # Task 2 text areas
+    texts = []
+    for index, prompt in enumerate(spec.prompts):
+        show_html(prompt.intro_html)
+        if index == 0 and spec.show_history:
+            show_journey_history(spec.day)
+        
+        text = st.text_area(
+            prompt.label,
+            value=journey.draft(day, index),
+            height=prompt.height,
+            placeholder=prompt.placeholder,
+            key=prompt.key
+        )
+        
+        # The journey keeps the draft while the text area is off screen
+        journey.set_draft(day, index, text)
+        texts.append(text)
+    
+    # Submit button for Task 2
+    if st.button(spec.submit_label, key=spec.submit_key):
+        if all(text.strip() for text in texts):
+            # Save reflection
+            ack = save_reflection(spec, texts)
+            if ack is not None:
+                if spec.feedback_template:
+                    feedback_text = spec.feedback_template.format(*texts)
+                else:
+                    feedback_text = texts[0]
+                journey.set_pending_save(day, ack, feedback_text)
+            else:
+                st.error("❌ Error saving reflection. Please try again.")
+        else:
+            st.warning(spec.missing_warning)
+    
+    # The reflection only counts as saved once the background writer acknowledges it
+    pending_save = journey.pending_save(day)
+    if pending_save is not None:
+        ack, feedback_text = pending_save
+        if not ack.done():
+            _poll_pending_save(ack)
+        elif ack.exception() is not None:
+            st.error(f"❌ Error saving reflection: {ack.exception()}. Please submit it again.")
+        else:
+            journey.clear_pending_save(day)
+            journey.complete(day, TASK2)
+            st.success(spec.saved_message)
+            # Fetch the AI feedback in the background so the page renders at once
+            journey.set_feedback(day, submit_groq_feedback(
+                feedback_text, journey.user_name, day
+            ))
+    
+    # Show AI feedback, which may still be arriving from an earlier run
+    if journey.feedback(day) is not None:
+        show_ai_feedback(journey.feedback(day), spec.thinking_message)
+    
+    # Show completion status
+    if journey.completed(day, TASK2):
+        show_html(spec.task2_done_html)
+    
+    show_html(spec.after_task2_html)
+    
+    # Day completion check
+    if journey.day_done(day):
+        show_html(spec.day_done_html)
+    
+    checkpoint_journey()
+
+def show_day_screen(day):
+    """Main function to display a day's screen"""
+    spec = DAYS[day]
+    
+    # Custom CSS for the day, only sent when the page does not have it yet
+    use_style("page", day_css(spec))
+    
+    # Main container
+    st.markdown(f'<div class="day{day}-container">', unsafe_allow_html=True)
+    
+    # Header, welcome message and Task 1
+    show_html(spec.intro_html)
+    
+    # Each panel re-runs on its own when its widgets change, instead of app.py
+    show_timer_panel(spec)
+    show_reflection_panel(spec)
+    
+    # Navigation
+    st.markdown("<br><br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 1, 1])
+    
+    with col1:
+        if st.button("🏠 Back to Home", key="back_home"):
+            go_to_day(None)
+    
+    with col2:
+        if st.button(spec.reset_label, key=f"reset_day{day}"):
+            # Reset all of this day's progress, and empty its text areas
+            current_journey().reset_day(day)
+            for prompt in spec.prompts:
+                st.session_state.pop(prompt.key, None)
+            st.rerun()
+    
+    with col3:
+        if st.button(spec.next_label, key=spec.next_key):
+            go_to_day(spec.next_day)
+    
+    # Close main container
+    st.markdown('</div>', unsafe_allow_html=True)
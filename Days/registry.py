@@ -0,0 +1,34 @@
+import functools
+import importlib
+import streamlit as st
+
+# Day screens are imported the first time they are selected, since a session
+# usually shows one day. Days 1-14 share the data-driven renderer in
+# Days.engine; Day 15 is a free-form page of its own.
+DAY_SCREENS = {day: ("Days.engine", "show_day_screen", (day,)) for day in range(1, 15)}
+DAY_SCREENS[15] = ("Days.WHY_I_MADE_YOU", "show_why_i_made_you_screen", ())
+
+def load_day_screen(day):
+    """Import the module for a day on first use and return its screen function"""
+    module_name, function_name, args = DAY_SCREENS[day]
+    # import_module caches in sys.modules, so only the first call pays the import
+    screen = getattr(importlib.import_module(module_name), function_name)
+    return functools.partial(screen, *args)
+
+def routed_day():
+    """The day named by the ?day= query parameter, or None for the home grid"""
+    try:
+        day = int(st.query_params.get("day"))
+    except (TypeError, ValueError):
+        return None
+    return day if day in DAY_SCREENS else None
+
+def go_to_day(day):
+    """Point the URL at a day, or home for None, and re-run the page for it"""
+    # Streamlit pushes each query string change onto the browser history, and
+    # back/forward re-runs the page with the older one
+    if day is None:
+        st.query_params.pop("day", None)
+    else:
+        st.query_params["day"] = str(day)
+    st.rerun()
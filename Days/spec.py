@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+
+from soundscape import Soundscape
+
+
+@dataclass(frozen=True)
+class Palette:
+    """Colours that make up a day's look"""
+    title: str
+    subtitle: str
+    accent: str
+    hover: str
+    # "r, g, b" triples used inside rgba() glows
+    hover_glow: str
+    focus_glow: str
+    quote_from: str
+    quote_to: str
+
+
+@dataclass(frozen=True)
+class Prompt:
+    """One journaling text area and the task it is saved under"""
+    task: str
+    label: str
+    placeholder: str
+    key: str
+    height: int = 200
+    # Cards rendered just above the text area
+    intro_html: tuple = ()
+
+
+@dataclass(frozen=True)
+class DaySpec:
+    """Everything that makes one day of the journey different from the others"""
+    day: int
+    icon: str
+    palette: Palette
+    # Header, welcome message and Task 1 card, in page order
+    intro_html: tuple
+    # Task 1: timed stillness practice
+    start_label: str
+    start_key: str
+    duration: int
+    music_message: str
+    music_hint: str
+    task1_done_html: tuple
+    # Task 2: reflection
+    prompts: tuple
+    submit_label: str
+    submit_key: str
+    saved_message: str
+    missing_warning: str
+    thinking_message: str
+    task2_done_html: tuple
+    day_done_html: tuple
+    reset_label: str
+    next_label: str = "➡️ Next Day"
+    next_key: str = "next_day"
+    next_day: int = None
+    timer_glow: str = None
+    extra_css: str = ""
+    # Cards shown under the Task 2 status, whatever the progress
+    after_task2_html: tuple = ()
+    # Combines the prompts' texts (in order) into the text sent for AI feedback
+    feedback_template: str = None
+    # Show the user's answers from earlier days above the first prompt
+    show_history: bool = False
+    # Synthesized ambient loop for Task 1; without one the day plays music/relax.mp3
+    soundscape: Soundscape = None
@@ -1,51 +1,30 @@
 import streamlit as st
 import time
 import os
-from Days.Day1 import show_day1_screen
-from Days.Day2 import show_day2_screen
-from Days.Day3 import show_day3_screen
-from Days.Day4 import show_day4_screen
-from Days.Day5 import show_day5_screen
-from Days.Day6 import show_day6_screen
-from Days.Day7 import show_day7_screen
-from Days.Day8 import show_day8_screen
-from Days.Day9 import show_day9_screen
-from Days.Day10 import show_day10_screen
-from Days.Day11 import show_day11_screen
-from Days.Day12 import show_day12_screen
-from Days.Day13 import show_day13_screen
-from Days.Day14 import show_day14_screen
-from Days.WHY_I_MADE_YOU import show_why_i_made_you_screen
+from Days.registry import go_to_day, load_day_screen, routed_day
+from theme import themed_css, use_style
+from journey import checkpoint_journey, current_journey, forget_journey, remember_journey
 
-# Page configuration - must be first Streamlit command
-st.set_page_config(
-    page_title="YOU - Mental Wellness Journey",
-    page_icon="🌙",
-    layout="centered",
-    initial_sidebar_state="collapsed"
-)
-
-# Custom CSS for dark neon gradient theme
-st.markdown("""
-<style>
+# Page-wide styles; $primary, $background, ... come from the [theme] in config.toml
+APP_CSS = """
     /* Hide Streamlit default elements */
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
     header {visibility: hidden;}
-    
+
     /* Main app background with neon gradient */
     .stApp {
-        background: linear-gradient(135deg, #0c0c0c 0%, #1a0033 25%, #000428 50%, #004e92 75%, #0c0c0c 100%);
+        background: linear-gradient(135deg, $background 0%, $secondary_background 25%, #000428 50%, #004e92 75%, $background 100%);
         background-size: 400% 400%;
         animation: gradientShift 8s ease infinite;
     }
-    
+
     @keyframes gradientShift {
         0% { background-position: 0% 50%; }
         50% { background-position: 100% 50%; }
         100% { background-position: 0% 50%; }
     }
-    
+
     /* Main container styling - improved centering */
     .main-container {
         max-width: 600px;
@@ -58,22 +37,22 @@ st.markdown("""
         justify-content: center;
         animation: fadeIn 2s ease-in;
     }
-    
+
     @keyframes fadeIn {
         from { opacity: 0; transform: translateY(30px); }
         to { opacity: 1; transform: translateY(0); }
     }
-    
+
     /* Title styling with neon glow effect - ensure center alignment */
     .neon-title {
         font-size: 5rem;
         font-weight: bold;
-        color: #00ffff;
+        color: $primary;
         text-shadow: 
-            0 0 5px #00ffff,
-            0 0 10px #00ffff,
-            0 0 20px #00ffff,
-            0 0 40px #00ffff;
+            0 0 5px $primary,
+            0 0 10px $primary,
+            0 0 20px $primary,
+            0 0 40px $primary;
         margin-bottom: 1rem;
         font-family: 'Arial Black', sans-serif;
         letter-spacing: 3px;
@@ -86,12 +65,12 @@ st.markdown("""
         margin-left: auto;
         margin-right: auto;
     }
-    
+
     @keyframes pulse {
         0%, 100% { opacity: 1; }
         50% { opacity: 0.8; }
     }
-    
+
     /* Subtitle styling */
     .subtitle {
         font-size: 1.5rem;
@@ -107,52 +86,52 @@ st.markdown("""
         margin-left: auto;
         margin-right: auto;
     }
-    
+
     /* Input field styling */
     .stTextInput > div > div > input {
         background-color: rgba(255, 255, 255, 0.1);
-        border: 2px solid #00ffff;
+        border: 2px solid $primary;
         border-radius: 10px;
         color: #000000 !important;
         font-size: 1.1rem;
         padding: 0.8rem;
         backdrop-filter: blur(10px);
-        caret-color: #ffffff !important;
+        caret-color: $text !important;
     }
-    
+
     .stTextInput > div > div > input:focus {
         border-color: #ff00ff;
         box-shadow: 0 0 15px rgba(255, 0, 255, 0.5);
         color: #000000 !important;
-        caret-color: #ffffff !important;
+        caret-color: $text !important;
     }
-    
+
     .stNumberInput > div > div > input {
         background-color: rgba(255, 255, 255, 0.1);
-        border: 2px solid #00ffff;
+        border: 2px solid $primary;
         border-radius: 10px;
-        color: #ffffff;
+        color: $text;
         font-size: 1.1rem;
         padding: 0.8rem;
         backdrop-filter: blur(10px);
     }
-    
+
     .stNumberInput > div > div > input:focus {
         border-color: #ff00ff;
         box-shadow: 0 0 15px rgba(255, 0, 255, 0.5);
     }
-    
+
     /* Input labels */
     .stTextInput > label, .stNumberInput > label {
-        color: #ffffff;
+        color: $text;
         font-weight: bold;
         font-size: 1.1rem;
         margin-bottom: 0.5rem;
     }
-    
+
     /* Button styling */
     .stButton > button {
-        background: linear-gradient(45deg, #ff00ff, #00ffff);
+        background: linear-gradient(45deg, #ff00ff, $primary);
         border: none;
         border-radius: 25px;
         color: white;
@@ -164,36 +143,36 @@ st.markdown("""
         box-shadow: 0 4px 15px rgba(255, 0, 255, 0.3);
         width: 100%;
     }
-    
+
     .stButton > button:hover {
         transform: translateY(-2px);
         box-shadow: 0 6px 20px rgba(255, 0, 255, 0.5);
-        background: linear-gradient(45deg, #00ffff, #ff00ff);
+        background: linear-gradient(45deg, $primary, #ff00ff);
     }
-    
+
     /* Welcome message styling */
     .welcome-message {
         background: rgba(255, 255, 255, 0.1);
-        border: 2px solid #00ffff;
+        border: 2px solid $primary;
         border-radius: 15px;
         padding: 2rem;
         margin: 2rem 0;
         backdrop-filter: blur(10px);
         animation: slideIn 0.5s ease-out;
     }
-    
+
     @keyframes slideIn {
         from { transform: translateX(-100%); opacity: 0; }
         to { transform: translateX(0); opacity: 1; }
     }
-    
+
     .welcome-text {
-        color: #00ffff;
+        color: $primary;
         font-size: 1.5rem;
         font-weight: bold;
         margin-bottom: 1rem;
     }
-    
+
     /* Warning message styling */
     .warning-message {
         background: rgba(255, 0, 0, 0.2);
@@ -205,13 +184,13 @@ st.markdown("""
         margin: 1rem 0;
         animation: shake 0.5s ease-in-out;
     }
-    
+
     @keyframes shake {
         0%, 20%, 40%, 60%, 80% { transform: translateX(0); }
         10%, 30%, 50%, 70% { transform: translateX(-5px); }
         15%, 35%, 55%, 75% { transform: translateX(5px); }
     }
-    
+
     /* Responsive design */
     @media (max-width: 768px) {
         .neon-title {
@@ -224,22 +203,7 @@ st.markdown("""
             padding: 1rem;
         }
     }
-</style>
-""", unsafe_allow_html=True)
 
-# Initialize session state for user data
-if 'user_name' not in st.session_state:
-    st.session_state.user_name = ""
-if 'user_age' not in st.session_state:
-    st.session_state.user_age = 0
-if 'journey_started' not in st.session_state:
-    st.session_state.journey_started = False
-
-# Main app container
-st.markdown('<div class="main-container">', unsafe_allow_html=True)
-
-st.markdown("""
-<style>
     .you-title {
         text-align: center;
         font-size: 5rem;
@@ -284,21 +248,7 @@ st.markdown("""
         height: 6.5rem;
         margin-bottom: 1.5rem;
     }
-</style>
-<div class="title-container">
-    <span class="emoji-float emoji-1">💙</span>
-    <span class="emoji-float emoji-2">✨</span>
-    <span class="emoji-float emoji-3">🌟</span>
-    <span class="emoji-float emoji-4">💜</span>
-    <div class="you-title">
-        <span class="you-y">Y</span><span class="you-o">O</span><span class="you-u">U</span>
-    </div>
-</div>
-""", unsafe_allow_html=True)
 
-# Stylish subtitle with colored, bold first letters
-st.markdown("""
-<style>
     .custom-subtitle {
         display: flex;
         justify-content: center;
@@ -324,7 +274,40 @@ st.markdown("""
         vertical-align: middle;
         text-shadow: 0 2px 12px rgba(139,92,246,0.15);
     }
-</style>
+"""
+
+# Page configuration - must be first Streamlit command
+st.set_page_config(
+    page_title="YOU - Mental Wellness Journey",
+    page_icon="🌙",
+    layout="centered",
+    initial_sidebar_state="collapsed"
+)
+
+# Custom CSS for dark neon gradient theme, sent to the browser once per session
+use_style("app", themed_css(APP_CSS))
+
+# Name, age and progress for this session, restored from its checkpoint after a
+# reload or a reconnect, once the browser offers the token it stored
+journey = current_journey()
+
+# Main app container
+st.markdown('<div class="main-container">', unsafe_allow_html=True)
+
+st.markdown("""
+<div class="title-container">
+    <span class="emoji-float emoji-1">💙</span>
+    <span class="emoji-float emoji-2">✨</span>
+    <span class="emoji-float emoji-3">🌟</span>
+    <span class="emoji-float emoji-4">💜</span>
+    <div class="you-title">
+        <span class="you-y">Y</span><span class="you-o">O</span><span class="you-u">U</span>
+    </div>
+</div>
+""", unsafe_allow_html=True)
+
+# Stylish subtitle with colored, bold first letters
+st.markdown("""
 <div class="custom-subtitle">
     <span class="subtitle-word subtitle-y"><span>Y</span>ourself</span>
     <span style="color: #b19cd9; font-size: 1rem; margin: 0 0.5rem;">•</span>
@@ -334,8 +317,11 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# The day to show comes from the URL (?day=N), so reloads and deep links keep it
+current_day = routed_day()
+
 # Check if journey has already started
-if not st.session_state.journey_started:
+if not journey.started:
     # Input section
     st.markdown("---")
     
@@ -372,14 +358,23 @@ if not st.session_state.journey_started:
                 unsafe_allow_html=True
             )
         else:
-            # Store user data in session state
-            st.session_state.user_name = name.strip()
-            st.session_state.user_age = age
-            st.session_state.journey_started = True
+            # Store user data in the session's journey
+            journey.user_name = name.strip()
+            journey.user_age = age
+            journey.started = True
             
             # Force rerun to show welcome message
             st.rerun()
 
+elif current_day is not None:
+    # A day button, a deep link or back/forward shows only that day's screen;
+    # the home grid is not built at all
+    try:
+        # Only the requested day's module is ever imported
+        load_day_screen(current_day)()
+    except Exception as e:
+        st.error(f"Error loading Day {current_day}: {str(e)}")
+
 else:
     st.markdown(
         f'''
@@ -406,60 +401,25 @@ else:
     # Create grid layout with day blocks
     st.markdown('<div class="days-container">', unsafe_allow_html=True)
 
-    selected_day = st.session_state.get("selected_day", None)
     for day in range(1, 16):
         theme = day_themes[day-1]
-        btn = st.button(f"Day {day}: {theme}", key=f"day_{day}")
-        if btn:
-            st.session_state.selected_day = day
-            selected_day = day
-
-        # Show selected day content just below its button
-        if selected_day == day:
-            try:
-                if day == 1:
-                    show_day1_screen()
-                elif day == 2:
-                    show_day2_screen()
-                elif day == 3:
-                    show_day3_screen()
-                elif day == 4:
-                    show_day4_screen()
-                elif day == 5:
-                    show_day5_screen()
-                elif day == 6:
-                    show_day6_screen()
-                elif day == 7:
-                    show_day7_screen()
-                elif day == 8:
-                    show_day8_screen()
-                elif day == 9:
-                    show_day9_screen()
-                elif day == 10:
-                    show_day10_screen()
-                elif day == 11:
-                    show_day11_screen()
-                elif day == 12:
-                    show_day12_screen()
-                elif day == 13:
-                    show_day13_screen()
-                elif day == 14:
-                    show_day14_screen()
-                elif day == 15:
-                    show_why_i_made_you_screen()
-                else:
-                    st.info(f"🚧 Day {day} content will be added here!")
-            except Exception as e:
-                st.error(f"Error loading Day {day}: {str(e)}")
+        if st.button(f"Day {day}: {theme}", key=f"day_{day}"):
+            go_to_day(day)
 
     st.markdown('</div>', unsafe_allow_html=True)
 
+    # Drop the last day's stylesheet once no day is open
+    use_style("page", "")
+
+if journey.started:
     # Reset journey button
     st.markdown("<br><br>", unsafe_allow_html=True)
     if st.button("🔄 Start Over", key="reset_button"):
-        # Clear session state
+        # Clear session state and its checkpoint, and go back to the home grid
+        forget_journey()
         for key in list(st.session_state.keys()):
             del st.session_state[key]
+        st.query_params.clear()
         st.rerun()
 
 # Close main container
@@ -473,4 +433,8 @@ st.markdown(
     </div>
     """,
     unsafe_allow_html=True
-)
\ No newline at end of file
+)
+
+# Save whatever this run changed, and keep the token to pick it up with in the browser
+checkpoint_journey()
+remember_journey()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import hashlib
+import shutil
+import threading
+from pathlib import Path
+
+APP_DIR = Path(__file__).parent
+MUSIC_PATH = APP_DIR / "music" / "relax.mp3"
+
+# Tracks are served as assets of the timer component, which plays them. Its
+# file handler sends the real audio MIME type (app/static sends anything but
+# images and fonts as text/plain with nosniff, which Firefox will not play)
+# and lets browsers cache anything but HTML. It cannot answer Range requests,
+# so the component downloads a track whole and plays it from a blob (see
+# startAudio in frontend/timer/index.html). URLs are relative to the
+# component's frame.
+AUDIO_DIR = APP_DIR / "frontend" / "timer" / "audio"
+AUDIO_URL = "audio"
+
+_publish_lock = threading.Lock()
+# source path -> (mtime, size, url), so a track is hashed once per process
+_published = {}
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def publish_track(path):
+    """Copy an audio file into the timer's asset folder under a content-hashed name and return its URL
+
+    The hash in the name never changes for the same bytes, so browsers can keep
+    the file; a new track gets a new URL.
+    Returns None when the file does not exist or cannot be published.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+
+    with _publish_lock:
+        known = _published.get(path)
+        if known and known[:2] == (stat.st_mtime, stat.st_size):
+            return known[2]
+
+        digest = _file_digest(path)
+        name = f"{path.stem}.{digest}{path.suffix}"
+        target = AUDIO_DIR / name
+        if not target.exists():
+            try:
+                AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+                # Copy then rename, so a request never gets a half-written file
+                tmp_path = target.with_suffix(f".{threading.get_ident()}.tmp")
+                shutil.copyfile(path, tmp_path)
+                tmp_path.replace(target)
+            except OSError:
+                return None
+
+        url = f"{AUDIO_URL}/{name}"
+        _published[path] = (stat.st_mtime, stat.st_size, url)
+        return url
+
+
+def ambient_track_url():
+    """URL of the ambient track played in the browser during Task 1, or None if it is missing"""
+    return publish_track(MUSIC_PATH)
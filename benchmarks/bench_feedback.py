@@ -0,0 +1,121 @@
+"""Load-test the AI feedback path against the local mock Groq server
+
+Starts mock_groq.MockGroqServer in-process, points utils at it through
+GROQ_BASE_URL, then submits reflections from many simulated users at a steady
+rate and reports end-to-end latency, how many answers came from Groq rather
+than the local engine, and the model router's stats and reasons for its
+choices. No network or quota is used, and a fixed seed makes the mock's
+latencies and failures repeat from run to run.
+
+Run from the repository root:
+
+    python benchmarks/bench_feedback.py [requests] [users] [profile] [rate]
+
+Profiles: healthy, slow, flaky, throttled, retired (see PROFILES). Rate is
+submissions per second; 0 submits them all at once, which mostly measures how
+fast the scheduler turns away the ones past its line (QueueFull).
+"""
+import json
+import os
+from collections import Counter
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from mock_groq import REPLIES, MockGroqServer  # noqa: E402
+
+PROFILES = {
+    "healthy": {"latency": "lognormal:0.3,0.3"},
+    "slow": {"latency": "lognormal:2.0,0.6"},
+    "flaky": {"latency": "lognormal:0.3,0.3", "error_rate": 0.3},
+    "throttled": {"latency": "lognormal:0.3,0.3", "rate_limit_rate": 0.3, "retry_after": 0.5},
+    # The primary model is gone; the router has to move to the others
+    "retired": {"latency": "lognormal:0.3,0.3", "retired_models": ("llama3-8b-8192",)},
+}
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    users = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    profile = sys.argv[3] if len(sys.argv) > 3 else "healthy"
+    rate = float(sys.argv[4]) if len(sys.argv) > 4 else 5
+
+    with MockGroqServer(token_delay=0.01, seed=1, **PROFILES[profile]) as server:
+        os.environ["GROQ_BASE_URL"] = server.base_url
+        os.environ.setdefault("GROQ_API_KEY", "mock")
+
+        import utils
+        from feedback_cache import FeedbackCache
+
+        # Every reflection is new, and nothing is read from or left on disk
+        utils.feedback_cache = FeedbackCache()
+
+        latencies = []
+        finished = threading.Semaphore(0)
+
+        def record_latency(future, submitted_at):
+            # Timed when the answer lands, not when this loop gets round to it
+            latencies.append(time.perf_counter() - submitted_at)
+            finished.release()
+
+        start = time.perf_counter()
+        submitted = []
+        for index in range(requests):
+            if rate:
+                time.sleep(max(0.0, start + index / rate - time.perf_counter()))
+            text = f"Reflection {index}: today I noticed how often I worry about what others think."
+            submitted_at = time.perf_counter()
+            pending = utils.submit_groq_feedback(
+                text, user_name=f"user{index % users}", day=index % 14 + 1, hedge_window=None,
+            )
+            pending._future.add_done_callback(
+                lambda future, submitted_at=submitted_at: record_latency(future, submitted_at)
+            )
+            submitted.append(pending)
+
+        # Futures wake their waiters before running callbacks, so count the callbacks
+        for _ in range(requests):
+            finished.acquire()
+        elapsed = time.perf_counter() - start
+        # The mock only ever answers with one of its REPLIES
+        from_groq = sum(pending.result() in REPLIES for pending in submitted)
+
+    latencies.sort()
+    results = {
+        "profile": profile,
+        "requests": requests,
+        "users": users,
+        "rate": rate,
+        "seconds": elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "from_groq": from_groq,
+        "from_local": requests - from_groq,
+        "mock": server.counts,
+        "router": {
+            model: {name: value for name, value in stats.items() if name != "cooling_for"}
+            for model, stats in utils.model_router.stats().items()
+        },
+        # Why each of the latest requests went where it did
+        "decisions": Counter(
+            f"{decision['model']}: {decision['reason'].split(' (')[0]}"
+            for decision in utils.model_router.decisions()
+        ),
+    }
+    print(f"{profile}: {requests} requests from {users} users at {rate:g}/s in {elapsed:.2f} s")
+    print(f"  latency p50 {results['p50_ms']:.0f} ms, p95 {results['p95_ms']:.0f} ms")
+    print(f"  answered by Groq {from_groq}, by the local engine {requests - from_groq}")
+    print(f"  mock saw {server.counts}")
+    print(f"  routing of the last {sum(results['decisions'].values())} calls:")
+    for decision, count in results["decisions"].most_common():
+        print(f"    {count:4d}  {decision}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Compare server time per interaction: re-running app.py vs. only the day's panel
+
+Since the timer and reflection panels became fragments, a keystroke or timer
+button re-runs only the panel it belongs to. This drives both through
+Streamlit's AppTest: the whole script with a day selected (what every
+interaction cost before), and just the panel the interaction lands in.
+
+Run from the repository root:
+
+    python benchmarks/bench_interactions.py [runs] [day]
+"""
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import journey as journey_module  # noqa: E402
+from journey import Journey  # noqa: E402
+from storage import SessionStore  # noqa: E402
+
+
+def reflection_panel(day):
+    from Days.content import DAYS
+    from Days.engine import show_reflection_panel
+    show_reflection_panel(DAYS[day])
+
+
+def timer_panel(day):
+    from Days.content import DAYS
+    from Days.engine import show_timer_panel
+    show_timer_panel(DAYS[day])
+
+
+def full_app(day):
+    at = AppTest.from_file(str(ROOT / "app.py"), default_timeout=30)
+    journey = Journey()
+    journey.user_name = "Bench"
+    journey.started = True
+    at.session_state.journey = journey
+    at.query_params["day"] = day
+    return at
+
+
+def panel(script, day):
+    return AppTest.from_function(script, args=(day,), default_timeout=30)
+
+
+def time_keystrokes(at, runs):
+    """Seconds per run after typing into the first reflection box"""
+    at.run()
+    timings = []
+    for index in range(runs):
+        at.text_area[0].input(f"draft {index}")
+        start = time.perf_counter()
+        at.run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def time_timer_toggles(at, runs):
+    """Seconds per run for pressing start, then stop, on the timer"""
+    at.run()
+    timings = []
+    for _ in range(runs):
+        for label in ("start", "stop"):
+            button = next(b for b in at.button if b.key.startswith(label))
+            button.click()
+            start = time.perf_counter()
+            at.run()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    day = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    # Checkpoints are part of the cost, but go to a scratch database
+    journey_module.session_store = SessionStore(Path(tempfile.mkdtemp()) / "sessions.db")
+
+    results = {}
+    for interaction, measure, script in (
+        ("keystroke", time_keystrokes, reflection_panel),
+        ("timer", time_timer_toggles, timer_panel),
+    ):
+        full = measure(full_app(day), runs)
+        fragment = measure(panel(script, day), runs)
+        results[interaction] = {
+            "full_rerun_ms": statistics.median(full) * 1000,
+            "fragment_ms": statistics.median(fragment) * 1000,
+        }
+
+    for interaction, stats in results.items():
+        print(f"{interaction:>9}: full rerun {stats['full_rerun_ms']:.1f} ms, "
+              f"fragment {stats['fragment_ms']:.1f} ms "
+              f"({stats['full_rerun_ms'] / stats['fragment_ms']:.1f}x less)")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
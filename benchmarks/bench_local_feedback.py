@@ -0,0 +1,63 @@
+"""Measure how long the offline feedback engine takes to answer a reflection
+
+Times local_feedback() on a short, a typical and a very long reflection for
+every day of the journey, plus the one-off cost of building the matrix.
+
+Run from the repository root:
+
+    python benchmarks/bench_local_feedback.py [calls]
+"""
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from local_feedback import LocalFeedbackEngine, local_feedback  # noqa: E402
+
+REFLECTIONS = {
+    "short": "I am scared of failing.",
+    "typical": (
+        "Lately I have been scared of failing my exams and letting my family down. "
+        "When I sit with it, I notice the fear is mostly about being judged, and that "
+        "I rarely give myself credit for how hard I work."
+    ),
+    # A long paste
+    "long": " ".join(["I keep worrying about my future, my career and money at night."] * 40),
+}
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+
+    start = time.perf_counter()
+    LocalFeedbackEngine()
+    results = {"build_ms": (time.perf_counter() - start) * 1000}
+
+    for name, text in REFLECTIONS.items():
+        timings = []
+        for day in range(1, 15):
+            for _ in range(calls):
+                start = time.perf_counter()
+                local_feedback(text, day)
+                timings.append(time.perf_counter() - start)
+        timings.sort()
+        results[name] = {
+            "chars": len(text),
+            "median_us": statistics.median(timings) * 1e6,
+            "p99_us": timings[int(len(timings) * 0.99)] * 1e6,
+        }
+
+    print(f"engine built in {results['build_ms']:.1f} ms")
+    for name in REFLECTIONS:
+        stats = results[name]
+        print(f"{name:>7} ({stats['chars']} chars): median {stats['median_us']:.0f} us, "
+              f"p99 {stats['p99_us']:.0f} us")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Compare submit latency: committing reflections inline vs. the write-behind queue
+
+Many threads (standing in for sessions) save reflections at once into a
+scratch database. "inline" commits each save on the submitting thread, as
+save_reflection used to; "write_behind" hands it to ReflectionWriter and
+only the enqueue is on the submitting thread. For the queue, the time until
+the save is acknowledged as committed is reported too, with the number of
+commits it took.
+
+Run from the repository root:
+
+    python benchmarks/bench_reflection_writes.py [saves] [threads] [sync]
+
+sync is OFF, NORMAL or FULL (SQLite's synchronous setting).
+"""
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from storage import ReflectionStore, ReflectionWriter  # noqa: E402
+
+
+def record(index):
+    return [(index % 14 + 1, f"journey{index}", f"user{index}", "Task 2: Reflection", f"Reflection {index}. " * 40)]
+
+
+def run_threads(threads, saves, save):
+    """Call save(index) from several threads at once; return per-call seconds"""
+    timings = []
+    lock = threading.Lock()
+    start = threading.Barrier(threads)
+
+    def worker(offset):
+        start.wait()
+        mine = []
+        for index in range(offset, saves, threads):
+            began = time.perf_counter()
+            save(index)
+            mine.append(time.perf_counter() - began)
+        with lock:
+            timings.extend(mine)
+
+    workers = [threading.Thread(target=worker, args=(offset,)) for offset in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return timings
+
+
+def summary(timings):
+    timings = sorted(timings)
+    return {
+        "p50_ms": statistics.median(timings) * 1000,
+        "p95_ms": timings[int(len(timings) * 0.95)] * 1000,
+    }
+
+
+def main():
+    saves = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    threads = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    sync = sys.argv[3].upper() if len(sys.argv) > 3 else "FULL"
+    scratch = Path(tempfile.mkdtemp())
+
+    inline_store = ReflectionStore(scratch / "inline.db", sync=sync)
+    inline = run_threads(threads, saves, lambda index: inline_store.add_many(record(index)))
+
+    store = ReflectionStore(scratch / "write_behind.db", sync=sync)
+    writer = ReflectionWriter(store)
+    commits = []
+    add_many = store.add_many
+    store.add_many = lambda records: commits.append(len(records)) or add_many(records)
+    acked = []
+
+    def save(index):
+        submitted_at = time.perf_counter()
+        ack = writer.submit(record(index))
+        ack.add_done_callback(lambda _: acked.append(time.perf_counter() - submitted_at))
+
+    submit = run_threads(threads, saves, save)
+    # Drains the queue, as happens at shutdown
+    writer.close()
+
+    results = {
+        "saves": saves,
+        "threads": threads,
+        "sync": sync,
+        "inline": summary(inline),
+        "write_behind_submit": summary(submit),
+        "write_behind_ack": summary(acked),
+        "commits": len(commits),
+        "mean_batch": statistics.mean(commits),
+    }
+    print(f"{saves} saves from {threads} threads, synchronous={sync}")
+    print(f"        inline: p50 {results['inline']['p50_ms']:.2f} ms, p95 {results['inline']['p95_ms']:.2f} ms")
+    print(f"  write-behind: p50 {results['write_behind_submit']['p50_ms']:.3f} ms, "
+          f"p95 {results['write_behind_submit']['p95_ms']:.3f} ms to submit")
+    print(f"  acknowledged: p50 {results['write_behind_ack']['p50_ms']:.2f} ms, "
+          f"p95 {results['write_behind_ack']['p95_ms']:.2f} ms, "
+          f"{len(commits)} commits of {results['mean_batch']:.1f} saves on average")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""Measure how much memory one session's journey state takes
+
+Builds many sessions' worth of state, the way the app now keeps it (one
+Journey) and the way it used to (loose dayN_* keys), and divides what
+tracemalloc saw by the session count.
+Drafts are unique per session, so their text is counted in both layouts. The
+open day's text areas are keyed in both, so both also hold its drafts under
+the widget keys, as Streamlit's session state does.
+
+Run from the repository root:
+
+    python benchmarks/bench_session_memory.py [sessions] [days] [draft_chars]
+"""
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from Days.content import DAYS  # noqa: E402
+from journey import TASK1, TASK2, Journey  # noqa: E402
+
+
+def draft(session, day, index, chars):
+    return (f"Session {session}, day {day}, prompt {index}: " + "I noticed something. " * chars)[:chars]
+
+
+def legacy_session(session, days, chars):
+    """The old layout: a dict of dayN_* keys like init_dayN_session_state() made"""
+    state = {"user_name": f"user{session}", "user_age": 30, "journey_started": True}
+    for day in range(1, days + 1):
+        prefix = f"day{day}_"
+        state[prefix + "task1_completed"] = True
+        state[prefix + "task2_completed"] = True
+        state[prefix + "timer_running"] = False
+        state[prefix + "timer_start"] = time.time()
+        for index, prompt in enumerate(DAYS[day].prompts):
+            text = draft(session, day, index, chars)
+            state[prefix + ("reflection_text" if index == 0 else f"prompt{index}_text")] = text
+            if day == days:
+                # The day on screen also had its draft under the widget key
+                state[prompt.key] = text
+    return state
+
+
+def journey_session(session, days, chars):
+    """The new layout: one Journey, beside the widget state of the day on screen"""
+    journey = Journey()
+    journey.user_name = f"user{session}"
+    journey.user_age = 30
+    journey.started = True
+    state = {"journey": journey}
+    for day in range(1, days + 1):
+        journey.complete(day, TASK1)
+        journey.complete(day, TASK2)
+        for index, prompt in enumerate(DAYS[day].prompts):
+            text = draft(session, day, index, chars)
+            journey.set_draft(day, index, text)
+            if day == days:
+                # The text areas are still keyed, so their values sit in session state too
+                state[prompt.key] = text
+    return state
+
+
+def bytes_per_session(build, sessions, days, chars):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [build(session, days, chars) for session in range(sessions)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return used / sessions
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 14
+    chars = int(sys.argv[3]) if len(sys.argv) > 3 else 600
+
+    results = {}
+    for name, build in (("legacy_keys", legacy_session), ("journey", journey_session)):
+        results[name] = {"bytes_per_session": bytes_per_session(build, sessions, days, chars)}
+        # Only the state itself, no drafts
+        results[name]["bytes_without_drafts"] = bytes_per_session(build, sessions, days, 0)
+        results[name]["sessions_per_gib"] = int(2 ** 30 / results[name]["bytes_per_session"])
+
+    print(f"{sessions} sessions, {days} days each, {chars}-character drafts")
+    for name, stats in results.items():
+        print(f"{name:>11}: {stats['bytes_per_session'] / 1024:.1f} KiB per session "
+              f"({stats['bytes_without_drafts']:.0f} B without drafts), "
+              f"{stats['sessions_per_gib']} sessions per GiB")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Measure checkpoint writes and restores in the session store
+
+Fills a scratch SessionStore with many journeys, then times restoring random
+ones (what a reload or reconnect does) and re-saving them (what a run that
+changed something does). Restores are also timed each on a thread of its own,
+since Streamlit runs every rerun on a new thread. Also prints SQLite's plan
+for the restore query, to show it is a single primary-key lookup.
+
+Run from the repository root:
+
+    python benchmarks/bench_session_store.py [sessions] [samples]
+"""
+import json
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from journey import TASK1, TASK2, Journey  # noqa: E402
+from storage import SessionStore  # noqa: E402
+
+
+def sample_journey(index):
+    journey = Journey(f"token{index:08d}")
+    journey.user_name = f"user{index}"
+    journey.user_age = 30
+    journey.started = True
+    for day in range(1, index % 14 + 2):
+        journey.complete(day, TASK1)
+        journey.complete(day, TASK2)
+        journey.set_draft(day, 0, f"Day {day} reflection for user {index}. " * 15)
+    journey.start_timer(index % 14 + 1)
+    return journey
+
+
+def percentiles(timings):
+    timings = sorted(timings)
+    return {
+        "p50_us": statistics.median(timings) * 1e6,
+        "p95_us": timings[int(len(timings) * 0.95)] * 1e6,
+    }
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    samples = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+
+    store = SessionStore(Path(tempfile.mkdtemp()) / "sessions.db")
+    records = {}
+    for index in range(sessions):
+        journey = sample_journey(index)
+        records[journey.token] = journey.to_record()
+        store.save(journey.token, records[journey.token])
+
+    tokens = random.Random(0).choices(list(records), k=samples)
+    restore = []
+    for token in tokens:
+        start = time.perf_counter()
+        Journey.from_record(store.load(token), token)
+        restore.append(time.perf_counter() - start)
+    fresh_thread = []
+    for token in tokens[:samples // 4]:
+        def restore_once(token=token):
+            start = time.perf_counter()
+            Journey.from_record(store.load(token), token)
+            fresh_thread.append(time.perf_counter() - start)
+        thread = threading.Thread(target=restore_once)
+        thread.start()
+        thread.join()
+    save = []
+    for token in tokens:
+        start = time.perf_counter()
+        store.save(token, records[token])
+        save.append(time.perf_counter() - start)
+
+    with store._lock:
+        plan = store._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT state FROM sessions WHERE token = ?", (tokens[0],)
+        ).fetchall()
+    results = {
+        "sessions": sessions,
+        "restore": percentiles(restore),
+        "restore_fresh_thread": percentiles(fresh_thread),
+        "checkpoint": percentiles(save),
+        "record_bytes": statistics.mean(len(record.encode("utf-8")) for record in records.values()),
+        "plan": [row[-1] for row in plan],
+    }
+    print(f"{sessions} sessions stored, {samples} samples")
+    print(f"  restore    p50 {results['restore']['p50_us']:.0f} us, p95 {results['restore']['p95_us']:.0f} us")
+    print(f"  restore on a new thread p50 {results['restore_fresh_thread']['p50_us']:.0f} us, "
+          f"p95 {results['restore_fresh_thread']['p95_us']:.0f} us")
+    print(f"  checkpoint p50 {results['checkpoint']['p50_us']:.0f} us, p95 {results['checkpoint']['p95_us']:.0f} us")
+    print(f"  query plan: {'; '.join(results['plan'])}")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
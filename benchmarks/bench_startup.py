@@ -0,0 +1,90 @@
+"""Compare the cold start of the home page with one that renders a day
+
+Days are imported the first time one is opened, so a home-page start loads
+only what app.py imports at the top (the registry, theme and journey). A
+start on a day also imports the day engine, and with it the Groq client,
+the timer, the soundscape synthesizer and the day specs. Each measurement
+runs in a fresh interpreter so module caches do not leak between runs.
+Streamlit itself is imported before timing starts, because both starts pay
+for it.
+
+Run from the repository root:
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# What app.py imports before it knows which page to show
+APP_IMPORTS = (
+    "import Days.registry\n"
+    "import theme\n"
+    "import journey\n"
+)
+
+STARTS = {
+    # The home grid: no day screen is imported
+    "home": APP_IMPORTS,
+    # A ?day= link or a day button: the day's screen is imported too
+    "day": APP_IMPORTS + (
+        "from Days.registry import load_day_screen\n"
+        "load_day_screen(1)\n"
+    ),
+}
+
+TIME_PROBE = """
+import time
+import streamlit
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+MEMORY_PROBE = """
+import tracemalloc
+import streamlit
+tracemalloc.start()
+{code}
+print(tracemalloc.get_traced_memory()[1])
+"""
+
+
+def run_probe(template, code):
+    result = subprocess.run(
+        [sys.executable, "-c", template.format(code=code)],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    results = {}
+    for name, code in STARTS.items():
+        timings = [run_probe(TIME_PROBE, code) for _ in range(runs)]
+        results[name] = {
+            "median_ms": statistics.median(timings) * 1000,
+            "min_ms": min(timings) * 1000,
+            "peak_kib": run_probe(MEMORY_PROBE, code) / 1024,
+        }
+
+    for name, stats in results.items():
+        print(f"{name:>4}: median {stats['median_ms']:.1f} ms, "
+              f"min {stats['min_ms']:.1f} ms, peak {stats['peak_kib']:.0f} KiB")
+    deferred = results["day"]["median_ms"] - results["home"]["median_ms"]
+    speedup = results["day"]["median_ms"] / results["home"]["median_ms"]
+    print(f"the home page starts {speedup:.1f}x faster than a day; "
+          f"opening the first day adds {deferred:.0f} ms of imports")
+    print(json.dumps(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+import threading
+import time
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half-open"
+
+
+class CircuitBreaker:
+    """Stops calling a failing service for a cool-down, then lets one probe through
+
+    Closed: calls go through and consecutive failures are counted.
+    Open: after failure_threshold failures in a row, calls are refused for cooldown seconds.
+    Half-open: one probe call is allowed; success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold=3, cooldown=30):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        # When the half-open probe was let through, or None if no probe is out
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    def _cooled_down(self, now):
+        return now - self._opened_at >= self.cooldown
+
+    def rejecting(self):
+        """True if a call made now would be refused (does not use up the probe)"""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == OPEN:
+                return not self._cooled_down(now)
+            if self.state == HALF_OPEN:
+                return self._probe_started is not None and now - self._probe_started < self.cooldown
+            return False
+
+    def allow(self):
+        """Return True if a call may go ahead; in half-open state only one caller gets True"""
+        now = time.monotonic()
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN:
+                if not self._cooled_down(now):
+                    return False
+                self.state = HALF_OPEN
+                self._probe_started = None
+            # A probe that never reported back (e.g. an abandoned stream) is
+            # given up on after one cool-down, so the circuit cannot stick
+            if self._probe_started is not None and now - self._probe_started < self.cooldown:
+                return False
+            self._probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started = None
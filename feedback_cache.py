@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+
+class FeedbackCache:
+    """Content-addressed cache of AI feedback with TTL, LRU eviction and an optional disk tier
+
+    The disk tier is bounded too: expired files are deleted, and past
+    max_disk_entries the least recently used ones (by mtime, which a hit
+    refreshes) go first.
+    """
+
+    # Disk writes between sweeps of the disk tier
+    PRUNE_EVERY = 64
+
+    def __init__(self, max_entries=512, ttl=7 * 24 * 3600, disk_dir=None, max_disk_entries=4096):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.max_disk_entries = max_disk_entries
+        # key -> (expires_at, text), oldest use first
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Counts down to the next disk sweep; the first write sweeps what earlier runs left
+        self._writes_until_prune = 0
+
+    @staticmethod
+    def make_key(model, messages):
+        """Hash the model and full prompt, so template changes never reuse stale answers"""
+        payload = json.dumps([model, messages], sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _disk_path(self, key):
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def get(self, key):
+        """Return the cached feedback for a key, or None if missing or expired"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    return entry[1]
+                del self._entries[key]
+
+        if self.disk_dir is None:
+            return None
+
+        path = self._disk_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("expires_at", 0) <= now:
+            self._unlink(path)
+            return None
+
+        # A hit counts as a use for the disk tier's LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        # Promote disk hits into memory
+        self._remember(key, record["expires_at"], record["text"])
+        return record["text"]
+
+    def put(self, key, text):
+        """Store feedback for a key in memory and, if enabled, on disk"""
+        expires_at = time.time() + self.ttl
+        self._remember(key, expires_at, text)
+
+        if self.disk_dir is None:
+            return
+        try:
+            path = self._disk_path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so readers never see a half-written entry
+            tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "text": text}, f, ensure_ascii=False)
+            tmp_path.replace(path)
+        except OSError:
+            # The disk tier is best effort; the memory tier still holds the entry
+            pass
+
+        with self._lock:
+            self._writes_until_prune -= 1
+            prune = self._writes_until_prune <= 0
+            if prune:
+                self._writes_until_prune = self.PRUNE_EVERY
+        if prune:
+            self.prune_disk()
+
+    @staticmethod
+    def _unlink(path):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def prune_disk(self):
+        """Delete expired disk entries, then the least recently used past max_disk_entries"""
+        if self.disk_dir is None:
+            return
+        now = time.time()
+        files = []
+        for path in self.disk_dir.glob("*/*.json"):
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            # An entry expires ttl after it was written, and mtime is at least
+            # the write time, so this never drops a live entry
+            if mtime + self.ttl <= now:
+                self._unlink(path)
+            else:
+                files.append((mtime, path))
+        if len(files) > self.max_disk_entries:
+            files.sort()
+            for _, path in files[:len(files) - self.max_disk_entries]:
+                self._unlink(path)
+
+    def _remember(self, key, expires_at, text):
+        with self._lock:
+            self._entries[key] = (expires_at, text)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Forget everything held in memory (the disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,155 @@
+# Curated supportive feedback for the local engine in local_feedback.py.
+# Each entry is (days it fits, or None for any day; words the reflection might
+# use when it fits; the feedback itself). Keep each answer to two sentences.
+
+CORPUS = (
+    # Day 1: Things I dislike
+    ((1,), "dislike hate annoy irritate angry frustrated rude unfair people noise",
+     "💙 Naming what you dislike is a quiet act of honesty. Every irritation points toward something you value."),
+    ((1,), "myself dislike about me weakness habit insecure ashamed body",
+     "💙 Seeing the parts of yourself you struggle with takes courage. You can hold them gently while you grow."),
+    ((1,), "lies dishonest fake betrayal trust manipulation",
+     "💙 Your dislike of dishonesty shows how deeply you value truth. Let that value guide you, not the hurt."),
+    ((1,), "work job boss school pressure deadlines stress",
+     "💙 It makes sense that constant pressure wears on you. Noticing it is the first step to setting kinder limits."),
+    ((1,), "waste time scrolling phone lazy procrastinate",
+     "💙 Catching your own patterns without judging them is real progress. Small changes start with exactly this awareness."),
+
+    # Day 2: What makes me smile
+    ((2,), "smile laugh joy happy friends family together fun",
+     "💛 The people and moments that make you smile are a treasure map. Return to them often."),
+    ((2,), "nature sun sunrise sunset sky flowers rain walk outside",
+     "💛 Finding joy in the natural world is a gift you can open any day. Let that quiet wonder stay with you."),
+    ((2,), "pet dog cat animal puppy",
+     "💛 The simple love of an animal can soften even the hardest day. Your smile there is pure and real."),
+    ((2,), "music song dance sing movie book read",
+     "💛 The things that light you up are part of who you are. Make room for them without needing a reason."),
+    ((2,), "food coffee tea cooking baking eat",
+     "💛 Small everyday pleasures count as real happiness. Savoring them is a way of caring for yourself."),
+
+    # Day 3: What am I afraid of
+    ((3, 10), "afraid fear scared anxious anxiety worry panic nervous",
+     "💜 Naming a fear takes some of its power away. You were brave enough to look at it today."),
+    ((3, 10), "failure fail mistakes not good enough judged rejection",
+     "💜 Fear of failing often means you care deeply about doing well. You are allowed to be a work in progress."),
+    ((3, 10), "alone lonely abandoned lose losing loved ones death",
+     "💜 Fearing loss shows how much love you carry. Hold the people you cherish close, and be gentle with your heart."),
+    ((3, 10), "future uncertain unknown change career money",
+     "💜 Uncertainty feels heavy, but you have handled unknowns before. Take it one small step at a time."),
+    ((3, 10), "heights dark spiders dogs water flying sickness",
+     "💜 Even fears that seem small deserve kindness. Breathing through them slowly is real courage."),
+
+    # Day 4: Who am I without labels
+    ((4,), "labels identity who am i name role student daughter son mother father",
+     "🌌 You are so much more than any role you play. The part of you that notices is whole just as it is."),
+    ((4,), "curious kind caring creative calm gentle loving",
+     "🌌 The qualities you found beneath your labels are your true essence. Let them lead the way."),
+    ((4,), "lost confused don't know empty nothing",
+     "🌌 Not knowing who you are without labels is an honest place to begin. That open space is full of possibility."),
+    ((4,), "soul spirit awareness presence consciousness energy",
+     "🌌 Touching the awareness beneath the labels is a profound discovery. Rest in it whenever you need to."),
+
+    # Day 5: My mental safe space
+    ((5,), "safe space room home cozy warm blanket fireplace",
+     "🏡 What a peaceful sanctuary you have built. You can return there any time the world feels loud."),
+    ((5,), "beach ocean waves sea sand forest trees mountain garden",
+     "🏡 Your safe place in nature sounds deeply calming. Let its stillness live inside you."),
+    ((5,), "quiet silence peace alone calm breathe",
+     "🏡 Giving yourself a place of quiet is an act of self-care. Visit it often, even for a single breath."),
+    ((5,), "people grandmother mother friend hug someone",
+     "🏡 Bringing loved ones into your sanctuary shows how much safety their presence gives you. Carry that warmth with you."),
+
+    # Day 6: My daily loop
+    ((6,), "routine morning wake phone scroll coffee work sleep repeat",
+     "🔄 Seeing your daily loop clearly gives you the power to change one small piece of it. Start with the easiest one."),
+    ((6,), "tired exhausted drained energy late night sleep",
+     "🔄 Your tiredness is a message worth listening to. Rest is not a reward; it is part of the loop."),
+    ((6,), "habit pattern stuck same every day bored",
+     "🔄 Noticing the sameness is how every change begins. One new choice can shift the whole day."),
+    ((6,), "overthink thoughts mind racing worry compare",
+     "🔄 Catching your thought loops is a skill, and you are practising it. Each time you notice, you loosen their grip."),
+
+    # Day 7: People who shape me
+    ((7,), "friend family mother father parent sibling teacher mentor",
+     "💡 The people who shaped you live on in the way you care for others. Honour what they gave you."),
+    ((7,), "toxic drain hurt negative distance boundary",
+     "💡 Recognising who drains you is not unkind; it is wise. Your boundaries protect the light you carry."),
+    ((7,), "support encourage believe inspire grateful thankful",
+     "💡 Your gratitude for the people who lift you up is beautiful. Let them know what they mean to you."),
+    ((7,), "influence change became learned from",
+     "💡 Seeing how others shaped you helps you choose who you want to become. That choice is yours now."),
+
+    # Day 8: Me as a child
+    ((8,), "child childhood kid young little play toys memories",
+     "🧸 Your younger self is still with you, full of wonder. Give them the kindness they always deserved."),
+    ((8,), "innocent free imagination dream curious",
+     "🧸 The curiosity you had as a child has not disappeared. Let it come out to play again."),
+    ((8,), "sad hurt scared lonely childhood",
+     "🧸 Your inner child's pain deserves gentle attention. You can be the safe adult they needed."),
+    ((8,), "parents grandparents home school friends",
+     "🧸 The people and places of your childhood shaped your heart. Thank you for revisiting them with care."),
+
+    # Day 9: My creative self
+    ((9,), "create art draw paint write music design build",
+     "🎨 Your creative spark is real and worth nurturing. Make something small today, just for you."),
+    ((9,), "not creative can't talent blocked stuck",
+     "🎨 Creativity is not a talent you lack; it is a way of seeing you are already practising. Be patient with it."),
+    ((9,), "imagine vision dream colour color express",
+     "🎨 The way you imagine and express yourself is uniquely yours. Let it take up space."),
+
+    # Day 10: Facing it gently
+    ((10,), "face facing gently heart heartbeat body breathe",
+     "💜 Facing a fear gently, with breath and patience, is real bravery. You don't have to rush this."),
+    ((10,), "avoid hiding running away ignore",
+     "💜 Noticing where you avoid is a form of courage too. You can turn toward it a little at a time."),
+
+    # Day 11: My quiet power
+    ((11,), "strength strong power survived overcame resilient",
+     "🔥 You have already survived what once felt impossible. That quiet strength is still yours."),
+    ((11,), "hard difficult struggle pain challenge",
+     "🔥 Each challenge you faced built the strength you have now. Honour how far you have come."),
+    ((11,), "weak doubt not strong enough",
+     "🔥 Strength is not the absence of doubt; it is carrying on anyway. You have done that more often than you know."),
+
+    # Day 12: My guiding values
+    ((12,), "values honesty kindness respect family freedom growth",
+     "🧭 The values you named are a compass you can always trust. Let them guide your next choice."),
+    ((12,), "integrity authentic true myself principles",
+     "🧭 Living by your own principles takes courage. Your clarity here is something to be proud of."),
+    ((12,), "conflict compromise lost way betray values",
+     "🧭 Noticing when life pulls you away from your values is how you find your way back. Be gentle as you realign."),
+
+    # Day 13: If nothing stopped me
+    ((13,), "dream travel start business career achieve goal",
+     "🌅 Your dream matters, and naming it is the first step toward it. What is one small move you could make this week?"),
+    ((13,), "afraid stop money time holding back",
+     "🌅 The things holding you back are real, but so is your longing. Let the dream guide you one step at a time."),
+    ((13,), "help others change world impact",
+     "🌅 Wanting to make a difference shows the size of your heart. The world needs exactly what you carry."),
+
+    # Day 14: What I learned and carry forward
+    ((14,), "learned journey realized discovered myself grown",
+     "✨ Look how much you have discovered about yourself in these fourteen days. Carry that wisdom gently forward."),
+    ((14,), "carry forward practice continue keep habit daily",
+     "✨ Choosing what to carry forward turns this journey into a way of living. Trust yourself to keep going."),
+    ((14,), "grateful thankful proud changed different",
+     "✨ Your gratitude and pride are well earned. You showed up for yourself, day after day."),
+
+    # Any day
+    (None, "sad down depressed cry tears heavy",
+     "💙 Thank you for being honest about how heavy things feel. You don't have to carry it all at once."),
+    (None, "grateful thankful blessed appreciate",
+     "💙 Gratitude like yours has a way of multiplying. Keep noticing the good, however small."),
+    (None, "calm peace relaxed better lighter",
+     "💙 It's lovely that you found some calm today. Remember this feeling; you can come back to it."),
+    (None, "confused unsure don't know lost",
+     "💙 Not having answers yet is part of the process. Your willingness to look is what matters."),
+    (None, "love loved loving kindness compassion",
+     "💙 The love in your words shines through. Remember to offer some of it to yourself."),
+    (None, "change grow better improve learn",
+     "💙 Your wish to grow is already growth. Be proud of the small steps as much as the big ones."),
+    (None, "tired stress overwhelmed busy",
+     "💙 You've been carrying a lot. Pausing to reflect like this is a real gift to yourself."),
+    (None, "",
+     "💙 Your reflection is meaningful. Every step of self-discovery matters."),
+)
@@ -0,0 +1,106 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future
+
+
+class QueueFull(Exception):
+    """Raised by FairScheduler.submit when the waiting line is already full"""
+
+
+class FairScheduler:
+    """Runs jobs on an executor at most max_running at a time, fair across users
+
+    Waiting jobs are started round-robin: one job per user per turn, so a user
+    who submits many times cannot push everyone else to the back of the line.
+    """
+
+    def __init__(self, executor, max_running=4, max_waiting=32):
+        self._executor = executor
+        self.max_running = max_running
+        self.max_waiting = max_waiting
+        self._running = 0
+        # user -> deque of (future, fn, args); dict order is the order of turns
+        self._waiting = OrderedDict()
+        self._waiting_count = 0
+        self._paused_until = 0.0
+        self._resume_timer = None
+        self._lock = threading.Lock()
+
+    def submit(self, user, fn, *args):
+        """Queue fn(*args) for a user and return a Future for its result"""
+        future = Future()
+        with self._lock:
+            if self._waiting_count >= self.max_waiting:
+                raise QueueFull(f"{self._waiting_count} jobs already waiting")
+            self._waiting.setdefault(user, deque()).append((future, fn, args))
+            self._waiting_count += 1
+        self._dispatch()
+        return future
+
+    def position(self, future):
+        """1-based place in line of a waiting job, or None once it has started"""
+        with self._lock:
+            lines = list(self._waiting.values())
+            place = 0
+            # Walk the line in the order the round-robin will start jobs
+            for turn in range(max((len(line) for line in lines), default=0)):
+                for line in lines:
+                    if turn < len(line):
+                        place += 1
+                        if line[turn][0] is future:
+                            return place
+            return None
+
+    def pause(self, seconds):
+        """Start no new jobs for a while, e.g. for the Retry-After of a 429"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self._dispatch()
+
+    def _arm_resume(self, delay):
+        # Called with the lock held; one timer at a time, set for the latest pause
+        if self._resume_timer is not None:
+            self._resume_timer.cancel()
+        self._resume_timer = threading.Timer(delay, self._dispatch)
+        self._resume_timer.daemon = True
+        self._resume_timer.start()
+
+    def _dispatch(self):
+        started = []
+        with self._lock:
+            paused_for = self._paused_until - time.monotonic()
+            if paused_for > 0:
+                if self._waiting:
+                    self._arm_resume(paused_for)
+                return
+            while self._running < self.max_running and self._waiting:
+                user, line = next(iter(self._waiting.items()))
+                started.append(line.popleft())
+                # This user's next job goes to the back of the turn order
+                del self._waiting[user]
+                if line:
+                    self._waiting[user] = line
+                self._waiting_count -= 1
+                self._running += 1
+
+        for future, fn, args in started:
+            if future.set_running_or_notify_cancel():
+                self._executor.submit(self._run, future, fn, args)
+            else:
+                self._finished()
+
+    def _run(self, future, fn, args):
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            self._finished()
+
+    def _finished(self):
+        with self._lock:
+            self._running -= 1
+        self._dispatch()
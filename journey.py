@@ -0,0 +1,224 @@
+import json
+import secrets
+import time
+from array import array
+from pathlib import Path
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+from storage import session_store
+
+# Days 1-15; day N lives at index N - 1 of the per-day arrays
+DAY_COUNT = 15
+
+# Bits in a day's completion flags
+TASK1 = 1
+TASK2 = 2
+
+# The token a journey is checkpointed under is a bearer secret: whoever has it
+# can read and overwrite the journey. So it is kept in the browser's
+# localStorage by this component, never in the URL that ?day= links are copied
+# from. Its value is the token the browser had stored, offered once per page load.
+_session_component = components.declare_component(
+    "journey_session",
+    path=str(Path(__file__).parent / "frontend" / "session"),
+)
+TOKEN_KEY = "journey_token"
+# The offered token last tried, so a stale one is tried only once
+TRIED_KEY = "journey_token_tried"
+
+# Query parameter that carried the token before it moved out of the URL
+LEGACY_TOKEN_PARAM = "session"
+
+
+class Journey:
+    """Everything one session remembers about the user's journey
+
+    Replaces the loose dayN_* session keys with one object per session.
+    Completion flags and timer starts sit in flat arrays, and each draft is
+    kept once, here, rather than mirrored beside its text area's widget state.
+    """
+
+    __slots__ = ("journey_id", "user_name", "user_age", "started", "_flags", "_timer_starts", "_drafts",
+                 "_feedback", "_saves", "token", "_saved_hash")
+
+    def __init__(self, token=None):
+        # Identifies this journey's reflections in the store; the name is only
+        # for display, since two people can type the same one
+        self.journey_id = secrets.token_hex(8)
+        self.user_name = ""
+        self.user_age = 0
+        self.started = False
+        # One byte of TASK1/TASK2 bits per day
+        self._flags = bytearray(DAY_COUNT)
+        # time.time() the day's timer was started at, 0.0 while it is not running
+        self._timer_starts = array("d", bytes(8 * DAY_COUNT))
+        # (day, prompt index) -> draft text; empty drafts are not stored
+        self._drafts = {}
+        # day -> PendingFeedback for the latest submission
+        self._feedback = {}
+        # day -> (Future acknowledging the background write of its reflection,
+        # text to ask feedback on once it lands); kept while unacknowledged or failed
+        self._saves = {}
+        # Checkpoint token, given out once the journey starts, and what was last saved
+        self.token = token
+        self._saved_hash = None
+
+    def completed(self, day, task):
+        return bool(self._flags[day - 1] & task)
+
+    def complete(self, day, task):
+        self._flags[day - 1] |= task
+
+    def day_done(self, day):
+        return self._flags[day - 1] == TASK1 | TASK2
+
+    def timer_start(self, day):
+        """When the day's timer was started, or None if it is not running"""
+        return self._timer_starts[day - 1] or None
+
+    def start_timer(self, day, at=None):
+        self._timer_starts[day - 1] = at or time.time()
+
+    def stop_timer(self, day):
+        self._timer_starts[day - 1] = 0.0
+
+    def draft(self, day, index):
+        return self._drafts.get((day, index), "")
+
+    def set_draft(self, day, index, text):
+        if text:
+            self._drafts[day, index] = text
+        else:
+            self._drafts.pop((day, index), None)
+
+    def feedback(self, day):
+        return self._feedback.get(day)
+
+    def set_feedback(self, day, pending):
+        self._feedback[day] = pending
+
+    def pending_save(self, day):
+        return self._saves.get(day)
+
+    def set_pending_save(self, day, ack, feedback_text):
+        self._saves[day] = (ack, feedback_text)
+
+    def clear_pending_save(self, day):
+        self._saves.pop(day, None)
+
+    def reset_day(self, day):
+        """Forget a day's progress, drafts and feedback"""
+        self._flags[day - 1] = 0
+        self._timer_starts[day - 1] = 0.0
+        for key in [key for key in self._drafts if key[0] == day]:
+            del self._drafts[key]
+        self._feedback.pop(day, None)
+        self._saves.pop(day, None)
+
+    def to_record(self):
+        """Serialize to a JSON string; feedback still arriving is left out"""
+        feedback = [[day, pending.shown_text()] for day, pending in self._feedback.items() if pending.settled()]
+        return json.dumps({
+            "journey_id": self.journey_id,
+            "user_name": self.user_name,
+            "user_age": self.user_age,
+            "started": self.started,
+            "flags": list(self._flags),
+            "timer_starts": list(self._timer_starts),
+            "drafts": [[day, index, text] for (day, index), text in self._drafts.items()],
+            "feedback": feedback,
+        }, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_record(cls, record, token=None):
+        """Rebuild a journey from to_record()'s output"""
+        from utils import PendingFeedback
+
+        data = json.loads(record)
+        journey = cls(token)
+        # Checkpoints from before journey ids keep the fresh one from __init__
+        journey.journey_id = data.get("journey_id", journey.journey_id)
+        journey.user_name = data["user_name"]
+        journey.user_age = data["user_age"]
+        journey.started = data["started"]
+        journey._flags[:] = bytes(data["flags"])
+        journey._timer_starts = array("d", data["timer_starts"])
+        journey._drafts = {(day, index): text for day, index, text in data["drafts"]}
+        journey._feedback = {day: PendingFeedback.ready(text) for day, text in data["feedback"]}
+        journey._saved_hash = hash(record)
+        return journey
+
+
+def _restore(token):
+    """The journey checkpointed under a token, or None"""
+    try:
+        record = session_store.load(token)
+    except Exception as e:
+        st.warning(f"Could not restore your session: {str(e)}")
+        return None
+    return Journey.from_record(record, token) if record else None
+
+
+def current_journey():
+    """The session's Journey: restored once the browser offers its stored token, else a new one"""
+    # Old links carried the token; drop it rather than keep passing it around
+    if LEGACY_TOKEN_PARAM in st.query_params:
+        del st.query_params[LEGACY_TOKEN_PARAM]
+    if "journey" not in st.session_state:
+        st.session_state.journey = Journey()
+    journey = st.session_state.journey
+    # The browser offers its token on the run after the page loads
+    offered = st.session_state.get(TOKEN_KEY)
+    if offered and journey.token is None and offered != st.session_state.get(TRIED_KEY):
+        st.session_state[TRIED_KEY] = offered
+        restored = _restore(offered)
+        if restored is not None:
+            st.session_state.journey = journey = restored
+    return journey
+
+
+def remember_journey():
+    """Keep the journey's token in the browser, so a reload or reconnect resumes it
+
+    Call once per full run, after checkpoint_journey().
+    """
+    journey = current_journey()
+    if journey.token:
+        token = journey.token
+    elif st.session_state.get(TOKEN_KEY) and st.session_state.get(TOKEN_KEY) == st.session_state.get(TRIED_KEY):
+        # The offered token restored nothing (expired or forgotten); clear it
+        token = ""
+    else:
+        token = None
+    _session_component(token=token, key=TOKEN_KEY, default=None)
+
+
+def checkpoint_journey():
+    """Save the session's journey if it changed since the last checkpoint
+
+    Restoring needs the token, which remember_journey() keeps in the browser.
+    """
+    journey = current_journey()
+    if not journey.started:
+        return
+    record = journey.to_record()
+    if hash(record) == journey._saved_hash:
+        return
+    if journey.token is None:
+        journey.token = secrets.token_urlsafe(16)
+    try:
+        session_store.save(journey.token, record)
+    except Exception as e:
+        st.warning(f"Could not save your progress: {str(e)}")
+        return
+    journey._saved_hash = hash(record)
+
+
+def forget_journey():
+    """Drop the session's journey and its checkpoint"""
+    journey = st.session_state.get("journey")
+    if journey is not None and journey.token:
+        session_store.delete(journey.token)
+    st.session_state.pop("journey", None)
@@ -0,0 +1,97 @@
+import re
+import zlib
+
+import numpy as np
+
+from feedback_corpus import CORPUS
+
+# Hashed feature space: words and word pairs land in one of this many buckets
+FEATURES = 1 << 12
+# Below this cosine similarity nothing in the corpus really matches the text
+MIN_SCORE = 0.05
+# Entries written for the current day win over general ones at a similar score
+DAY_BONUS = 0.1
+
+WORD = re.compile(r"[a-z']+")
+STOP_WORDS = frozenset(
+    "a an and are as at be been but by do for from had has have i i'm in is it its "
+    "it's me my of on or so that the their them they this to was we were what when "
+    "which who will with you your".split()
+)
+SUFFIXES = ("ing", "ed", "es", "ly", "s")
+
+
+def _stem(word):
+    # Crude, but enough for "fears" / "feared" / "fearing" to meet "fear"
+    if len(word) > 4:
+        for suffix in SUFFIXES:
+            if word.endswith(suffix):
+                return word[:-len(suffix)]
+    return word
+
+
+def _features(text):
+    """Bucket indices of a text's words and adjacent word pairs"""
+    words = [_stem(word) for word in WORD.findall(text.lower()) if word not in STOP_WORDS]
+    # crc32 rather than hash(), which is salted per process: every replica and
+    # restart must give the same reflection the same feedback
+    buckets = [zlib.crc32(word.encode("utf-8")) % FEATURES for word in words]
+    buckets += [zlib.crc32(f"{first} {second}".encode("utf-8")) % FEATURES for first, second in zip(words, words[1:])]
+    return buckets
+
+
+class LocalFeedbackEngine:
+    """Picks the corpus feedback closest to a reflection by hashed TF-IDF similarity"""
+
+    def __init__(self, corpus=CORPUS):
+        self.feedback = [feedback for _, _, feedback in corpus]
+
+        counts = np.zeros((len(corpus), FEATURES), dtype=np.float32)
+        for row, (_, cue, feedback) in enumerate(corpus):
+            np.add.at(counts[row], _features(f"{cue} {feedback}"), 1)
+        document_frequency = np.count_nonzero(counts, axis=0)
+        self.idf = np.log((1 + len(corpus)) / (1 + document_frequency)).astype(np.float32) + 1
+        matrix = counts * self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        self.matrix = matrix / np.where(norms > 0, norms, 1)
+
+        # Per day: which rows may answer, and the bonus for rows written for that day
+        self._rows = {}
+        self._bonus = {}
+        self._day_rows = {}
+        days = {day for entry_days, _, _ in corpus for day in entry_days or ()}
+        for day in days | {None}:
+            rows = [row for row, (entry_days, _, _) in enumerate(corpus) if entry_days is None or day in entry_days]
+            self._rows[day] = np.array(rows)
+            self._bonus[day] = np.array(
+                [DAY_BONUS if corpus[row][0] and day in corpus[row][0] else 0.0 for row in rows],
+                dtype=np.float32,
+            )
+            self._day_rows[day] = [row for row in rows if corpus[row][0]] or rows
+
+    def respond(self, text, day=None):
+        """Return the best-matching feedback for a reflection written on a given day"""
+        if day not in self._rows:
+            day = None
+        rows = self._rows[day]
+
+        buckets = _features(text)
+        if buckets:
+            query = np.bincount(buckets, minlength=FEATURES).astype(np.float32) * self.idf
+            scores = (self.matrix @ query)[rows] / np.linalg.norm(query)
+            best = int(np.argmax(scores + self._bonus[day]))
+            if scores[best] >= MIN_SCORE:
+                return self.feedback[rows[best]]
+
+        # Nothing matched: vary the answer by text, preferring this day's entries
+        day_rows = self._day_rows[day]
+        return self.feedback[day_rows[zlib.crc32(text.encode("utf-8")) % len(day_rows)]]
+
+
+# Built once at startup and shared by every session
+local_engine = LocalFeedbackEngine()
+
+
+def local_feedback(user_text, day=None):
+    """Supportive feedback chosen offline, in well under a millisecond"""
+    return local_engine.respond(user_text, day)
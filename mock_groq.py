@@ -0,0 +1,253 @@
+"""Local stand-in for Groq's chat completions endpoint, for offline benchmarks
+
+Answers POST /openai/v1/chat/completions like Groq does, streaming or not,
+with configurable latency, server errors, 429s (with Retry-After) and retired
+models. Outcomes and latencies come from a seeded generator, and the reply
+text is picked by a hash of the prompt, so runs are reproducible.
+
+Point the app at it with GROQ_BASE_URL (any GROQ_API_KEY is accepted):
+
+    python mock_groq.py --port 8765 --latency lognormal:0.6,0.5 --rate-limit-rate 0.1
+    GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=mock streamlit run app.py
+
+Latency specs (seconds until the first token): fixed:S, uniform:LO,HI,
+normal:MEAN,SD or lognormal:MEDIAN,SIGMA.
+"""
+import argparse
+import json
+import math
+import random
+import threading
+import time
+import uuid
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPLETIONS_PATH = "/openai/v1/chat/completions"
+
+REPLIES = (
+    "Your honesty with yourself is a quiet kind of courage. Keep listening to what your heart is telling you.",
+    "What you wrote shows real self-awareness. Be as gentle with yourself as you would be with a friend.",
+    "Every reflection like this one is a step toward knowing yourself better. You are doing beautifully.",
+    "There is strength in simply noticing how you feel. Let today's insight carry you forward.",
+    "You are growing, even when it doesn't feel like it. Trust the small steps you are taking.",
+)
+
+
+def parse_latency(spec):
+    """Turn a latency spec like "uniform:0.2,1.5" into a function of a random.Random"""
+    kind, _, params = spec.partition(":")
+    values = [float(value) for value in params.split(",") if value]
+    if kind == "fixed":
+        return lambda rng: values[0]
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda rng: rng.lognormvariate(math.log(values[0]), values[1])
+    raise ValueError(f"Unknown latency spec: {spec}")
+
+
+class MockGroqServer:
+    """Threaded HTTP server that behaves like Groq's chat completions API"""
+
+    def __init__(self, host="127.0.0.1", port=0, latency="fixed:0", error_rate=0.0,
+                 rate_limit_rate=0.0, retry_after=1.0, token_delay=0.0,
+                 model_latency=None, retired_models=(), seed=0):
+        self.latency = parse_latency(latency)
+        self.model_latency = {model: parse_latency(spec) for model, spec in (model_latency or {}).items()}
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.token_delay = token_delay
+        self.retired_models = set(retired_models)
+        self.counts = {"requests": 0, "ok": 0, "errors": 0, "rate_limited": 0, "retired": 0}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def start(self):
+        """Serve from a background thread"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mock-groq", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _draw(self, model):
+        """Decide a request's fate and latency in one step, so seeded runs repeat"""
+        with self._lock:
+            self.counts["requests"] += 1
+            roll = self._rng.random()
+            delay = self.model_latency.get(model, self.latency)(self._rng)
+            if model in self.retired_models:
+                outcome = "retired"
+            elif roll < self.rate_limit_rate:
+                outcome = "rate_limited"
+            elif roll < self.rate_limit_rate + self.error_rate:
+                outcome = "errors"
+            else:
+                outcome = "ok"
+            self.counts[outcome] += 1
+            return outcome, delay
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, payload, headers=()):
+                body = json.dumps(payload).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers:
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _send_error(self, status, message, error_type, code, headers=()):
+                self._send_json(status, {"error": {"message": message, "type": error_type, "code": code}}, headers)
+
+            def _write_chunk(self, data):
+                self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+                self.wfile.flush()
+
+            def do_POST(self):
+                # Read the body first, so a kept-alive connection stays in step
+                request = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+                if self.path.split("?")[0] != COMPLETIONS_PATH:
+                    self._send_error(404, "Unknown path", "invalid_request_error", "unknown_url")
+                    return
+                model = request.get("model", "")
+                outcome, delay = server._draw(model)
+
+                if outcome == "retired":
+                    self._send_error(404, f"The model `{model}` has been decommissioned",
+                                     "invalid_request_error", "model_decommissioned")
+                    return
+                if outcome == "rate_limited":
+                    self._send_error(429, f"Rate limit reached for model `{model}`", "tokens",
+                                     "rate_limit_exceeded", [("Retry-After", f"{server.retry_after:g}")])
+                    return
+                time.sleep(delay)
+                if outcome == "errors":
+                    self._send_error(500, "Internal server error", "internal_server_error", "internal_error")
+                    return
+
+                messages = request.get("messages") or [{}]
+                prompt = str(messages[-1].get("content", ""))
+                reply = REPLIES[zlib.crc32(prompt.encode("utf-8")) % len(REPLIES)]
+                completion_id = f"chatcmpl-{uuid.uuid4().hex}"
+                created = int(time.time())
+                if request.get("stream"):
+                    self._stream(completion_id, created, model, reply)
+                else:
+                    self._send_json(200, {
+                        "id": completion_id,
+                        "object": "chat.completion",
+                        "created": created,
+                        "model": model,
+                        "choices": [{
+                            "index": 0,
+                            "message": {"role": "assistant", "content": reply},
+                            "finish_reason": "stop",
+                            "logprobs": None,
+                        }],
+                        "usage": {
+                            "prompt_tokens": len(prompt) // 4,
+                            "completion_tokens": len(reply) // 4,
+                            "total_tokens": (len(prompt) + len(reply)) // 4,
+                        },
+                    })
+
+            def _stream(self, completion_id, created, model, reply):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+
+                def event(delta, finish_reason=None):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}],
+                    }
+                    self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+
+                event({"role": "assistant", "content": ""})
+                for index, word in enumerate(reply.split(" ")):
+                    if index and server.token_delay:
+                        time.sleep(server.token_delay)
+                    event({"content": word if index == 0 else " " + word})
+                event({}, "stop")
+                self._write_chunk(b"data: [DONE]\n\n")
+                self._write_chunk(b"")
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="lognormal:0.6,0.5", help="seconds until the first token")
+    parser.add_argument("--model-latency", action="append", default=[], metavar="MODEL=SPEC",
+                        help="latency spec for one model (repeatable)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of requests answered with a 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with a 429")
+    parser.add_argument("--token-delay", type=float, default=0.02, help="seconds between streamed words")
+    parser.add_argument("--retired", action="append", default=[], metavar="MODEL",
+                        help="model answered with 404 decommissioned (repeatable)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    server = MockGroqServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        token_delay=args.token_delay,
+        model_latency=dict(spec.split("=", 1) for spec in args.model_latency),
+        retired_models=args.retired,
+        seed=args.seed,
+    )
+    print(f"Mock Groq listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(server.counts))
+
+
+if __name__ == "__main__":
+    main()
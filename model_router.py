@@ -0,0 +1,114 @@
+import logging
+import random
+import threading
+import time
+from collections import deque
+
+# Outcomes remembered per model for the rolling stats
+WINDOW = 50
+# Fewer samples than this and a model's latency is treated as unknown
+MIN_SAMPLES = 5
+# A model failing more often than this over the window is skipped
+MAX_ERROR_RATE = 0.5
+# Share of requests sent to a random healthy model, so stats stay fresh
+EXPLORE_RATE = 0.05
+# How long a model is skipped after a 429 without Retry-After, and once retired
+RATE_LIMIT_COOLDOWN = 30
+RETIRED_COOLDOWN = 24 * 3600
+
+logger = logging.getLogger(__name__)
+
+
+def _percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+class ModelRouter:
+    """Sends each request to the fastest healthy model, by rolling latency and error rate
+
+    Models are given in order of preference; it decides between models that
+    have no stats yet. Every choice is kept in decisions() for inspection.
+    """
+
+    def __init__(self, models, history=100):
+        self.models = tuple(models)
+        # model -> deque of (seconds, ok) for the latest calls
+        self._outcomes = {model: deque(maxlen=WINDOW) for model in self.models}
+        self._cooling_until = {model: 0.0 for model in self.models}
+        self._decisions = deque(maxlen=history)
+        self._lock = threading.Lock()
+
+    def _model_stats(self, model, now):
+        outcomes = self._outcomes[model]
+        latencies = sorted(seconds for seconds, ok in outcomes if ok)
+        stats = {
+            "samples": len(outcomes),
+            "error_rate": sum(not ok for _, ok in outcomes) / len(outcomes) if outcomes else 0.0,
+            "p50": _percentile(latencies, 0.5) if latencies else None,
+            "p95": _percentile(latencies, 0.95) if latencies else None,
+            "cooling_for": max(0.0, self._cooling_until[model] - now),
+        }
+        stats["healthy"] = not stats["cooling_for"] and not (
+            stats["samples"] >= MIN_SAMPLES and stats["error_rate"] > MAX_ERROR_RATE
+        )
+        return stats
+
+    def stats(self):
+        """Rolling p50/p95 latency (seconds), error rate and health per model"""
+        now = time.monotonic()
+        with self._lock:
+            return {model: self._model_stats(model, now) for model in self.models}
+
+    def decisions(self):
+        """The latest routing decisions, oldest first"""
+        with self._lock:
+            return list(self._decisions)
+
+    def choose(self):
+        """Pick the model for the next request"""
+        now = time.monotonic()
+        with self._lock:
+            stats = {model: self._model_stats(model, now) for model in self.models}
+            healthy = [model for model in self.models if stats[model]["healthy"]]
+            measured = [model for model in healthy if stats[model]["p95"] is not None
+                        and stats[model]["samples"] >= MIN_SAMPLES]
+
+            if not healthy:
+                # Everything is struggling; the one back soonest is the best bet
+                model = min(self.models, key=lambda m: (stats[m]["cooling_for"], stats[m]["error_rate"]))
+                reason = "no healthy model, least bad"
+            elif len(healthy) > 1 and random.random() < EXPLORE_RATE:
+                model = random.choice(healthy)
+                reason = "exploring"
+            elif measured:
+                model = min(measured, key=lambda m: (stats[m]["p95"], stats[m]["p50"]))
+                reason = f"fastest healthy (p95 {stats[model]['p95']:.2f}s)"
+                # A preferred model with too few samples to judge yet gets a turn first
+                unmeasured = [m for m in healthy[:healthy.index(model)] if m not in measured]
+                if unmeasured:
+                    model = unmeasured[0]
+                    reason = "preferred, not yet measured"
+            else:
+                model = healthy[0]
+                reason = "preferred, not yet measured"
+
+            self._decisions.append({"at": time.time(), "model": model, "reason": reason, "stats": stats})
+        logger.debug("Routed feedback to %s: %s", model, reason)
+        return model
+
+    def record_success(self, model, seconds):
+        with self._lock:
+            self._outcomes[model].append((seconds, True))
+
+    def record_failure(self, model, seconds, cooldown=0):
+        """Count a failed call; a cooldown (e.g. Retry-After) also skips the model for a while"""
+        with self._lock:
+            self._outcomes[model].append((seconds, False))
+            if cooldown:
+                self._cooling_until[model] = max(self._cooling_until[model], time.monotonic() + cooldown)
+
+    def all_cooling(self):
+        """True if every model is sitting out a cooldown"""
+        now = time.monotonic()
+        with self._lock:
+            return all(until > now for until in self._cooling_until.values())
@@ -0,0 +1,130 @@
+import hashlib
+import heapq
+import math
+import re
+import threading
+from collections import Counter, OrderedDict
+
+from local_feedback import STOP_WORDS, WORD
+
+# Most the reflection itself may add to a feedback prompt, in estimated tokens
+REFLECTION_TOKEN_BUDGET = 400
+
+# Marks where sentences were left out of a trimmed reflection
+GAP = " … "
+
+# Trimmed reflections remembered, by a digest of the raw text
+TRIM_CACHE_SIZE = 256
+
+SENTENCE_END = re.compile(r"(?<=[.!?…])\s+|\n+")
+SPACES = re.compile(r"[^\S\n]+")
+BLANK_LINES = re.compile(r"\n\s*\n\s*")
+
+
+def normalize_whitespace(text):
+    """Collapse runs of spaces and blank lines and trim the ends"""
+    text = SPACES.sub(" ", text.replace("\r\n", "\n"))
+    text = BLANK_LINES.sub("\n\n", text)
+    return "\n".join(line.strip() for line in text.split("\n")).strip()
+
+
+def estimate_tokens(text):
+    """Rough token count: about four bytes of UTF-8 per token for Llama-style tokenizers"""
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+def _split_sentences(text):
+    return [sentence.strip() for sentence in SENTENCE_END.split(text) if sentence.strip()]
+
+
+def _clip(text, max_tokens, keep_end=False):
+    # Cut on a word boundary so the model never sees half a word
+    max_chars = max_tokens * 4
+    if len(text.encode("utf-8")) <= max_chars:
+        return text
+    if keep_end:
+        clipped = text.encode("utf-8")[-max_chars:].decode("utf-8", "ignore")
+        return clipped.partition(" ")[2] or clipped
+    clipped = text.encode("utf-8")[:max_chars].decode("utf-8", "ignore")
+    return clipped.rpartition(" ")[0] or clipped
+
+
+_trimmed = OrderedDict()
+_trimmed_lock = threading.Lock()
+
+
+def fit_to_budget(text, max_tokens=REFLECTION_TOKEN_BUDGET):
+    """Trim a reflection to max_tokens, keeping its opening and closing sentences
+
+    The sentences in between are kept by salience: those bringing in more of
+    the reflection's recurring words come first. Kept sentences stay in their
+    original order, with a marker wherever something was left out.
+    """
+    # A prompt is built for the cache key and again for the request itself.
+    # The cache is keyed on a digest, so it never holds on to a huge paste;
+    # what it keeps is already within the budget.
+    key = (hashlib.sha256(text.encode("utf-8")).digest(), max_tokens)
+    with _trimmed_lock:
+        if key in _trimmed:
+            _trimmed.move_to_end(key)
+            return _trimmed[key]
+    trimmed = _trim(text, max_tokens)
+    with _trimmed_lock:
+        _trimmed[key] = trimmed
+        if len(_trimmed) > TRIM_CACHE_SIZE:
+            _trimmed.popitem(last=False)
+    return trimmed
+
+
+def _trim(text, max_tokens):
+    text = normalize_whitespace(text)
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    sentences = _split_sentences(text)
+    if len(sentences) < 3:
+        half = max(1, (max_tokens - estimate_tokens(GAP)) // 2)
+        return _clip(text, half) + GAP + _clip(text, half, keep_end=True)
+
+    first, middle, last = sentences[0], sentences[1:-1], sentences[-1]
+    # The ends alone may already be too long; give each half of the budget
+    half = max(1, (max_tokens - 2 * estimate_tokens(GAP)) // 2)
+    first, last = _clip(first, half), _clip(last, half, keep_end=True)
+    spare = max_tokens - estimate_tokens(first) - estimate_tokens(last) - 2 * estimate_tokens(GAP)
+
+    words = [{word for word in WORD.findall(sentence.lower()) if word not in STOP_WORDS} for sentence in middle]
+    frequency = Counter(word for sentence_words in words for word in sentence_words)
+    covered = set()
+
+    def salience(index):
+        # Recurring words count most, but only the first time they are kept,
+        # so a pasted block of near-identical sentences cannot fill the budget
+        fresh = words[index] - covered
+        return sum(math.log1p(frequency[word]) for word in fresh) / math.sqrt(1 + len(words[index]))
+
+    # Lazy greedy: a sentence's salience only drops as words get covered, so a
+    # stale heap entry is re-scored and pushed back instead of rescanning all
+    heap = [(-salience(index), index) for index in range(len(middle))]
+    heapq.heapify(heap)
+    kept = set()
+    while heap and spare > 0:
+        _, index = heapq.heappop(heap)
+        current = salience(index)
+        if heap and -current > heap[0][0]:
+            heapq.heappush(heap, (-current, index))
+            continue
+        cost = estimate_tokens(middle[index]) + 1
+        if cost <= spare:
+            kept.add(index)
+            covered |= words[index]
+            spare -= cost
+
+    parts = [first]
+    previous = -1
+    for index in sorted(kept):
+        parts.append(GAP if index != previous + 1 else " ")
+        parts.append(middle[index])
+        previous = index
+    parts.append(GAP if previous != len(middle) - 1 else " ")
+    parts.append(last)
+    return "".join(parts)
@@ -0,0 +1,212 @@
+import hashlib
+import threading
+import wave
+from dataclasses import astuple, dataclass
+
+import numpy as np
+
+from audio import AUDIO_DIR, AUDIO_URL
+
+# Mono 16 kHz is plenty for noise beds, low tones and chimes and keeps each loop small
+SAMPLE_RATE = 16000
+# Bump when the synthesis changes, so loops cached on disk are rendered again
+SYNTH_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Soundscape:
+    """Recipe for one day's procedurally generated ambient loop"""
+    seconds: int = 20
+    # Noise bed: "white", "pink" or "brown" (None for none), softly low-passed at noise_cutoff Hz
+    noise: str = "pink"
+    noise_level: float = 0.3
+    noise_cutoff: float = 4000.0
+    # How deeply slow gusts swell the noise bed (0 keeps it steady)
+    wind: float = 0.0
+    # Sustained tones in Hz, each with a slightly detuned twin for a slow shimmer
+    drone: tuple = ()
+    drone_level: float = 0.15
+    # Struck tones in Hz at random times, chime_rate strikes per second on average
+    chimes: tuple = ()
+    chime_rate: float = 0.0
+    chime_level: float = 0.2
+    # Overtone ratios (bell-like by default) and how many seconds a strike rings for
+    chime_partials: tuple = (1.0, 2.76, 5.40)
+    chime_decay: float = 1.5
+    heartbeat_bpm: int = 0
+    heartbeat_level: float = 0.5
+    # Clock ticks per second and fire crackles per second (on average)
+    tick_rate: float = 0.0
+    tick_level: float = 0.2
+    crackle_rate: float = 0.0
+    crackle_level: float = 0.2
+    seed: int = 0
+
+
+def _normalized(layer):
+    peak = np.abs(layer).max()
+    return layer / peak if peak > 0 else layer
+
+
+def _loop_frequency(freq, n):
+    # A whole number of cycles per loop, so the loop joins without a click
+    cycles = max(1, round(freq * n / SAMPLE_RATE))
+    return cycles * SAMPLE_RATE / n
+
+
+def _place(positions, amplitudes, kernel, n):
+    """Add a copy of kernel at every position, wrapping around the end of the loop"""
+    impulses = np.zeros(n)
+    np.add.at(impulses, positions % n, amplitudes)
+    padded = np.zeros(n)
+    padded[:min(len(kernel), n)] = kernel[:n]
+    # Circular convolution, so strikes near the end ring on into the start
+    return np.fft.irfft(np.fft.rfft(impulses) * np.fft.rfft(padded), n)
+
+
+def _noise_bed(scape, n, rng):
+    freqs = np.fft.rfftfreq(n, 1 / SAMPLE_RATE)
+    freqs[0] = freqs[1]
+    spectrum = np.fft.rfft(rng.standard_normal(n))
+    if scape.noise == "pink":
+        spectrum /= np.sqrt(freqs)
+    elif scape.noise == "brown":
+        spectrum /= freqs
+    spectrum /= np.sqrt(1 + (freqs / scape.noise_cutoff) ** 4)
+    spectrum[0] = 0
+    # Shaping the spectrum of the whole loop keeps the noise periodic too
+    bed = _normalized(np.fft.irfft(spectrum, n))
+
+    if scape.wind:
+        # Gusts: noise made only of the loop's slowest (< 0.25 Hz) components
+        slow = np.zeros(len(freqs), dtype=complex)
+        bins = max(2, int(0.25 * n / SAMPLE_RATE))
+        slow[1:bins] = rng.standard_normal(bins - 1) + 1j * rng.standard_normal(bins - 1)
+        gust = _normalized(np.fft.irfft(slow, n))
+        bed *= (1 - scape.wind) + scape.wind * (gust + 1) / 2
+    return bed
+
+
+def _drone(scape, n):
+    t = np.arange(n) / SAMPLE_RATE
+    layer = np.zeros(n)
+    for freq in scape.drone:
+        for detune, gain in ((1.0, 1.0), (1.003, 0.6), (2.0, 0.25)):
+            layer += gain * np.sin(2 * np.pi * _loop_frequency(freq * detune, n) * t)
+    return _normalized(layer)
+
+
+def _chimes(scape, n, rng):
+    length = min(n, int(scape.chime_decay * 4 * SAMPLE_RATE))
+    t = np.arange(length) / SAMPLE_RATE
+    attack = np.minimum(1, t / 0.005)
+    count = rng.poisson(scape.chime_rate * scape.seconds)
+    positions = rng.integers(0, n, count)
+    amplitudes = rng.uniform(0.4, 1.0, count)
+    pitches = rng.integers(0, len(scape.chimes), count)
+
+    layer = np.zeros(n)
+    for index, freq in enumerate(scape.chimes):
+        kernel = sum(
+            np.sin(2 * np.pi * freq * ratio * t) * np.exp(-t * (rank + 1) / scape.chime_decay) / (rank + 1)
+            for rank, ratio in enumerate(scape.chime_partials)
+        )
+        struck = pitches == index
+        layer += _place(positions[struck], amplitudes[struck], attack * kernel, n)
+    return _normalized(layer)
+
+
+def _heartbeat(scape, n):
+    t = np.arange(int(0.6 * SAMPLE_RATE)) / SAMPLE_RATE
+    # "Lub" then a softer, lower "dub"
+    lub = np.sin(2 * np.pi * 60 * t) * np.exp(-t / 0.05) + 0.3 * np.sin(2 * np.pi * 120 * t) * np.exp(-t / 0.03)
+    dub_t = np.clip(t - 0.28, 0, None)
+    dub = (t >= 0.28) * 0.6 * np.sin(2 * np.pi * 48 * dub_t) * np.exp(-dub_t / 0.06)
+    beats = max(1, round(scape.heartbeat_bpm * scape.seconds / 60))
+    positions = np.arange(beats) * n // beats
+    return _normalized(_place(positions, np.ones(beats), lub + dub, n))
+
+
+def _click(rng, seconds):
+    burst = rng.standard_normal(int(seconds * SAMPLE_RATE))
+    # Differencing tilts the burst towards a bright, dry click
+    return np.diff(burst, prepend=0) * np.exp(-np.arange(len(burst)) / (len(burst) / 4))
+
+
+def _ticks(scape, n, rng):
+    ticks = max(1, round(scape.tick_rate * scape.seconds))
+    positions = np.arange(ticks) * n // ticks
+    # Tick, tock
+    amplitudes = np.where(np.arange(ticks) % 2, 0.7, 1.0)
+    return _normalized(_place(positions, amplitudes, _click(rng, 0.004), n))
+
+
+def _crackles(scape, n, rng):
+    count = rng.poisson(scape.crackle_rate * scape.seconds)
+    positions = rng.integers(0, n, count)
+    # Mostly faint pops with the odd loud snap
+    amplitudes = rng.uniform(0, 1, count) ** 3
+    return _normalized(_place(positions, amplitudes, _click(rng, 0.002), n))
+
+
+def render_soundscape(scape):
+    """Synthesize a seamless loop for a Soundscape as 16-bit samples"""
+    rng = np.random.default_rng(scape.seed)
+    n = scape.seconds * SAMPLE_RATE
+    mix = np.zeros(n)
+    if scape.noise:
+        mix += scape.noise_level * _noise_bed(scape, n, rng)
+    if scape.drone:
+        mix += scape.drone_level * _drone(scape, n)
+    if scape.chimes and scape.chime_rate:
+        mix += scape.chime_level * _chimes(scape, n, rng)
+    if scape.heartbeat_bpm:
+        mix += scape.heartbeat_level * _heartbeat(scape, n)
+    if scape.tick_rate:
+        mix += scape.tick_level * _ticks(scape, n, rng)
+    if scape.crackle_rate:
+        mix += scape.crackle_level * _crackles(scape, n, rng)
+    return (_normalized(mix) * 0.7 * 32767).astype(np.int16)
+
+
+def soundscape_key(scape):
+    """Hash of everything that shapes the rendered loop"""
+    payload = repr((SYNTH_VERSION, SAMPLE_RATE, astuple(scape)))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+_render_lock = threading.Lock()
+# soundscape key -> URL, once the loop is on disk
+_rendered = {}
+
+
+def soundscape_url(scape):
+    """Render a Soundscape to the timer's asset folder (once per deployment) and return its URL
+
+    Returns None when the loop cannot be written.
+    """
+    key = soundscape_key(scape)
+    url = _rendered.get(key)
+    if url:
+        return url
+
+    with _render_lock:
+        name = f"soundscape.{key}.wav"
+        target = AUDIO_DIR / name
+        if not target.exists():
+            try:
+                AUDIO_DIR.mkdir(parents=True, exist_ok=True)
+                # Write then rename, so a request never gets a half-written file
+                tmp_path = target.with_suffix(f".{threading.get_ident()}.tmp")
+                with wave.open(str(tmp_path), "wb") as f:
+                    f.setnchannels(1)
+                    f.setsampwidth(2)
+                    f.setframerate(SAMPLE_RATE)
+                    f.writeframes(render_soundscape(scape).astype("<i2").tobytes())
+                tmp_path.replace(target)
+            except OSError:
+                return None
+
+        url = f"{AUDIO_URL}/{name}"
+        _rendered[key] = url
+        return url
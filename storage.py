@@ -0,0 +1,354 @@
+import atexit
+import datetime
+import os
+import queue
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+
+DATA_DIR = Path("data")
+DB_PATH = DATA_DIR / "reflections.db"
+# Kept apart from the reflections, so checkpoints never queue behind their writes
+SESSIONS_DB_PATH = DATA_DIR / "sessions.db"
+
+# Checkpoints not touched for this long are dropped
+SESSION_TTL = 30 * 24 * 3600
+
+# When reflection commits reach the disk, as SQLite's synchronous setting:
+# OFF leaves it to the OS, NORMAL syncs at WAL checkpoints (a power cut can
+# lose the last commits, never corrupt), FULL syncs every commit
+REFLECTION_SYNC = os.environ.get("REFLECTION_SYNC", "NORMAL").upper()
+SYNC_MODES = ("OFF", "NORMAL", "FULL")
+
+# Most reflection batches the background writer commits in one transaction
+WRITE_BATCH = 256
+
+# Old per-submission files look like data/day3_reflection_2024-05-01_10-15-00.txt
+TEXT_FILE_PATTERN = re.compile(r"day(\d+)_reflection_(\d{4}-\d{2}-\d{2}_\d{2}-\d{2}-\d{2})\.txt$")
+TEXT_FILE_SEPARATOR = "=" * 50
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reflections (
+    id INTEGER PRIMARY KEY,
+    day INTEGER NOT NULL,
+    journey_id TEXT NOT NULL DEFAULT '',
+    user_name TEXT NOT NULL DEFAULT '',
+    task TEXT NOT NULL,
+    text TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS imported_files (
+    name TEXT PRIMARY KEY
+);
+"""
+
+# The first history index was keyed on the name people type, so anyone using
+# the same name as an earlier visitor saw that visitor's reflections
+DROP_NAME_INDEX = """
+DROP TRIGGER IF EXISTS index_latest_reflection;
+DROP TABLE IF EXISTS latest_reflections;
+"""
+
+JOURNEY_INDEX = """
+-- Per-journey index: the latest reflection for each (journey, day, task), so
+-- a journey's history is a primary-key range read of at most a few dozen rows.
+-- journey_id is generated per journey, never taken from what the user types.
+CREATE TABLE IF NOT EXISTS journey_reflections (
+    journey_id TEXT NOT NULL,
+    day INTEGER NOT NULL,
+    task TEXT NOT NULL,
+    reflection_id INTEGER NOT NULL,
+    PRIMARY KEY (journey_id, day, task)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS index_journey_reflection AFTER INSERT ON reflections
+WHEN NEW.journey_id != ''
+BEGIN
+    INSERT OR REPLACE INTO journey_reflections (journey_id, day, task, reflection_id)
+    VALUES (NEW.journey_id, NEW.day, NEW.task, NEW.id);
+END;
+"""
+
+
+SESSIONS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def _now():
+    return datetime.datetime.now().isoformat(sep=" ", timespec="seconds")
+
+
+class ReflectionStore:
+    """Append-only SQLite (WAL) store holding every submitted reflection"""
+
+    def __init__(self, path=DB_PATH, sync=REFLECTION_SYNC):
+        if sync not in SYNC_MODES:
+            raise ValueError(f"sync must be one of {', '.join(SYNC_MODES)}, not {sync!r}")
+        self.path = Path(path)
+        self.sync = sync
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self):
+        # sqlite3 connections must stay on the thread that made them
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            # WAL lets readers carry on while a writer appends
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.sync}")
+            self._local.conn = conn
+        if not self._schema_ready:
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    columns = {row[1] for row in conn.execute("PRAGMA table_info(reflections)")}
+                    if "journey_id" not in columns:
+                        # Rows saved before journeys had ids belong to no journey's history
+                        conn.execute("ALTER TABLE reflections ADD COLUMN journey_id TEXT NOT NULL DEFAULT ''")
+                    conn.executescript(DROP_NAME_INDEX)
+                    conn.executescript(JOURNEY_INDEX)
+                    self._schema_ready = True
+        return conn
+
+    def add_many(self, records):
+        """Append a batch of (day, journey_id, user_name, task, text[, created_at]) records in one commit"""
+        rows = []
+        for record in records:
+            day, journey_id, user_name, task, text = record[:5]
+            created_at = record[5] if len(record) > 5 else None
+            rows.append((day, journey_id or "", user_name or "", task, text, created_at or _now()))
+
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT INTO reflections (day, journey_id, user_name, task, text, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def journey_history(self, journey_id):
+        """Return {day: [{"task", "text", "created_at"}, ...]} with a journey's latest answers"""
+        history = {}
+        if not journey_id:
+            return history
+
+        conn = self._connect()
+        rows = conn.execute(
+            "SELECT r.day, r.task, r.text, r.created_at FROM journey_reflections j "
+            "JOIN reflections r ON r.id = j.reflection_id "
+            "WHERE j.journey_id = ? ORDER BY j.day, r.id",
+            (journey_id,),
+        )
+        for day, task, text, created_at in rows:
+            history.setdefault(day, []).append({"task": task, "text": text, "created_at": created_at})
+        return history
+
+    def import_text_files(self, data_dir=DATA_DIR):
+        """Import the old dayN_reflection_<timestamp>.txt files once; return how many were added"""
+        conn = self._connect()
+        done = {row[0] for row in conn.execute("SELECT name FROM imported_files")}
+
+        imported = 0
+        for path in sorted(Path(data_dir).glob("day*_reflection_*.txt")):
+            match = TEXT_FILE_PATTERN.match(path.name)
+            if not match or path.name in done:
+                continue
+
+            day = int(match.group(1))
+            created_at = datetime.datetime.strptime(match.group(2), "%Y-%m-%d_%H-%M-%S")
+            created_at = created_at.isoformat(sep=" ")
+            records = [
+                (day, "", task, text, created_at)
+                for task, text in _parse_text_file(path.read_text(encoding="utf-8"))
+            ]
+
+            with conn:
+                conn.executemany(
+                    "INSERT INTO reflections (day, user_name, task, text, created_at) VALUES (?, ?, ?, ?, ?)",
+                    records,
+                )
+                conn.execute("INSERT INTO imported_files (name) VALUES (?)", (path.name,))
+            imported += 1
+        return imported
+
+
+def _parse_text_file(content):
+    """Split an old reflection file into (task, text) pairs
+
+    Files start with a "Day N Reflection - <time>" line and a separator,
+    then one "<task heading>\\n\\n<text>" section per task (Day 14 has two).
+    """
+    sections = content.split("\n\n" + TEXT_FILE_SEPARATOR + "\n\n")
+    # The first section still carries the file header
+    header, _, first = sections[0].partition(TEXT_FILE_SEPARATOR + "\n\n")
+    sections[0] = first or header
+
+    pairs = []
+    for section in sections:
+        task, _, text = section.partition("\n\n")
+        pairs.append((task.strip(), text))
+    return pairs
+
+
+class ReflectionWriter:
+    """Write-behind queue in front of a ReflectionStore
+
+    submit() only enqueues and returns a Future, so a page never waits on the
+    disk. One background thread commits whatever has queued up in a single
+    transaction (group commit), so under load many submissions share each
+    commit and its sync. Queued writes are drained at interpreter exit.
+    """
+
+    def __init__(self, store, max_batch=WRITE_BATCH):
+        self.store = store
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def submit(self, records):
+        """Queue (day, journey_id, user_name, task, text[, created_at]) records to be committed together
+
+        The returned Future resolves to the number of records once they are
+        committed, or to the error that stopped them.
+        """
+        # Stamp them now, not when the writer gets to them
+        records = [tuple(record) if len(record) > 5 else (*record, _now()) for record in records]
+        ack = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("ReflectionWriter is closed")
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="reflection-writer", daemon=True)
+                self._thread.start()
+            self._queue.put((records, ack))
+        return ack
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # Everything that queued while the last commit ran goes in this one
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            if batch:
+                self._commit(batch)
+
+    def _commit(self, batch):
+        try:
+            self.store.add_many([record for records, _ in batch for record in records])
+        except Exception as e:
+            if len(batch) > 1:
+                # Commit them one by one, so one bad submission does not fail the rest
+                for item in batch:
+                    self._commit([item])
+                return
+            batch[0][1].set_exception(e)
+            return
+        for records, ack in batch:
+            ack.set_result(len(records))
+
+    def close(self, timeout=None):
+        """Stop taking writes, and wait for the queued ones to be committed"""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join(timeout)
+
+
+class SessionStore:
+    """SQLite (WAL) checkpoints of session state, keyed by a resumable token
+
+    Every process on this host pointed at the same file can pick up a session
+    where another left off, so a reconnect or a server restart does not lose
+    progress. SQLite's WAL needs shared memory, so the file must not sit on a
+    network filesystem shared between hosts; replicas on other machines need a
+    real shared database instead.
+    """
+
+    def __init__(self, path=SESSIONS_DB_PATH, ttl=SESSION_TTL):
+        self.path = Path(path)
+        self.ttl = ttl
+        self._conn = None
+        # Streamlit runs every rerun on a new thread, so a per-thread connection
+        # would be opened afresh on nearly every call; one shared connection is
+        # opened once and used by one thread at a time
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Called with the lock held
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SESSIONS_SCHEMA)
+            # Expired checkpoints are swept once per process
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE updated_at < ?", (time.time() - self.ttl,))
+            self._conn = conn
+        return self._conn
+
+    def load(self, token):
+        """Return the state saved under a token, or None"""
+        if not token:
+            return None
+        with self._lock:
+            # One primary-key lookup
+            row = self._connect().execute("SELECT state FROM sessions WHERE token = ?", (token,)).fetchone()
+        return row[0] if row else None
+
+    def save(self, token, state):
+        """Replace the state saved under a token"""
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sessions (token, state, updated_at) VALUES (?, ?, ?)",
+                    (token, state, time.time()),
+                )
+
+    def delete(self, token):
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("DELETE FROM sessions WHERE token = ?", (token,))
+
+
+# Shared by every session in the process
+reflection_store = ReflectionStore()
+reflection_writer = ReflectionWriter(reflection_store)
+session_store = SessionStore()
+
+atexit.register(reflection_writer.close)
+
+
+if __name__ == "__main__":
+    # One-time migration: python storage.py import-txt [data_dir]
+    if len(sys.argv) >= 2 and sys.argv[1] == "import-txt":
+        source = Path(sys.argv[2]) if len(sys.argv) > 2 else DATA_DIR
+        count = reflection_store.import_text_files(source)
+        print(f"Imported {count} reflection file(s) from {source} into {reflection_store.path}")
+    else:
+        print("Usage: python storage.py import-txt [data_dir]")
@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import utils  # noqa: E402
+from circuit_breaker import CircuitBreaker  # noqa: E402
+from feedback_cache import FeedbackCache  # noqa: E402
+from feedback_scheduler import FairScheduler  # noqa: E402
+from mock_groq import MockGroqServer  # noqa: E402
+from model_router import ModelRouter  # noqa: E402
+
+
+@pytest.fixture
+def mock_groq(monkeypatch):
+    """Start a MockGroqServer and point fresh feedback state at it
+
+    Call the fixture with MockGroqServer's options. The breaker, router,
+    scheduler and cache are replaced for the test, so no state leaks between
+    tests, and the router never explores, so its choices are predictable.
+    """
+    servers = []
+
+    def start(models=utils.FEEDBACK_MODELS, max_running=4, max_waiting=32, **options):
+        server = MockGroqServer(seed=1, **options).start()
+        servers.append(server)
+        monkeypatch.setenv("GROQ_BASE_URL", server.base_url)
+        monkeypatch.setenv("GROQ_API_KEY", "mock")
+        monkeypatch.setattr(utils, "model_router", ModelRouter(models))
+        monkeypatch.setattr(utils, "feedback_scheduler", FairScheduler(
+            utils._feedback_executor, max_running=max_running, max_waiting=max_waiting
+        ))
+        return server
+
+    monkeypatch.setattr(utils, "groq_breaker", CircuitBreaker(failure_threshold=3, cooldown=30))
+    monkeypatch.setattr(utils, "feedback_cache", FeedbackCache())
+    monkeypatch.setattr("model_router.EXPLORE_RATE", 0)
+    utils.reset_groq_client()
+    yield start
+    for server in servers:
+        server.stop()
+    utils.reset_groq_client()
@@ -0,0 +1,125 @@
+"""The AI feedback path against mock_groq.MockGroqServer, one resilience feature at a time"""
+import time
+
+import utils
+from circuit_breaker import CLOSED, OPEN
+from local_feedback import local_feedback
+from mock_groq import REPLIES
+
+# Longest any test waits for one answer
+WAIT = 15
+
+
+def finish(pending):
+    """Wait for a PendingFeedback and return its text"""
+    utils.wait([pending._future], timeout=WAIT)
+    assert pending.done()
+    return pending.result()
+
+
+def submit(text, user_name="tester", day=1, hedge_window=None):
+    return utils.submit_groq_feedback(text, user_name=user_name, day=day, hedge_window=hedge_window)
+
+
+def test_streams_groq_answer(mock_groq):
+    server = mock_groq(token_delay=0.001)
+    text = "Streaming: I felt calm after my walk today."
+    assert finish(submit(text)) in REPLIES
+    assert server.counts["ok"] == 1
+    assert utils.model_router.stats()[utils.FEEDBACK_MODELS[0]]["samples"] == 1
+
+
+def test_breaker_opens_after_repeated_failures(mock_groq):
+    server = mock_groq(error_rate=1.0)
+    for index in range(3):
+        text = f"Breaker {index}: nothing went right today."
+        assert finish(submit(text)) == local_feedback(text, 1)
+    assert utils.groq_breaker.state == OPEN
+
+    # While it is open, reflections are answered locally without calling Groq
+    text = "Breaker 3: still a hard day."
+    pending = submit(text)
+    assert pending.done()
+    assert pending.result() == local_feedback(text, 1)
+    assert server.counts["requests"] == 3
+
+
+def test_scheduler_sheds_past_its_line(mock_groq):
+    server = mock_groq(latency="fixed:0.5", max_running=1, max_waiting=1)
+    running = submit("Scheduler 0: the first one in.", user_name="a")
+    waiting = submit("Scheduler 1: the second one waits.", user_name="b")
+    assert waiting.queue_position() == 1
+
+    # The line is full, so the third is answered locally at once
+    text = "Scheduler 2: the third one is turned away."
+    shed = submit(text, user_name="c")
+    assert shed.done()
+    assert shed.result() == local_feedback(text, 1)
+
+    assert finish(running) in REPLIES
+    assert finish(waiting) in REPLIES
+    assert server.counts["requests"] == 2
+
+
+def test_rate_limits_wait_for_retry_after(mock_groq):
+    # One model, so every 429 has to be waited out rather than routed around
+    server = mock_groq(models=("only-model",), rate_limit_rate=1.0, retry_after=0.3)
+    text = "Retry-After: I kept getting interrupted."
+    started = time.monotonic()
+    assert finish(submit(text)) == local_feedback(text, 1)
+
+    assert server.counts["rate_limited"] == utils.RATE_LIMIT_ATTEMPTS
+    # Every attempt but the last waited out the Retry-After
+    assert time.monotonic() - started >= 0.3 * (utils.RATE_LIMIT_ATTEMPTS - 1)
+    # Being throttled is not an outage
+    assert utils.groq_breaker.state == CLOSED
+
+
+def test_router_moves_off_a_retired_model(mock_groq):
+    retired = utils.FEEDBACK_MODELS[0]
+    server = mock_groq(retired_models=(retired,))
+    assert finish(submit("Router: the old model is gone.")) in REPLIES
+
+    assert server.counts["retired"] == 1
+    assert server.counts["ok"] == 1
+    stats = utils.model_router.stats()
+    assert not stats[retired]["healthy"]
+    assert stats[utils.FEEDBACK_MODELS[1]]["samples"] == 1
+    assert utils.groq_breaker.state == CLOSED
+
+
+def test_identical_reflections_share_one_call(mock_groq):
+    server = mock_groq(latency="fixed:0.3")
+    text = "Coalescing: the same words, submitted twice."
+    first = submit(text, user_name="a")
+    second = submit(text, user_name="b")
+    assert second is first
+    assert finish(first) in REPLIES
+
+    # Once finished, the answer comes from the cache
+    again = submit(text, user_name="c")
+    assert again.done()
+    assert again.result() == first.result()
+    assert server.counts["requests"] == 1
+
+
+def test_hedge_shows_groq_answer_inside_the_window(mock_groq):
+    mock_groq(latency="fixed:0")
+    pending = submit("Hedging: a quick answer.", hedge_window=5)
+    assert finish(pending) in REPLIES
+    assert pending.shown_text() == pending.result()
+
+
+def test_hedge_keeps_local_answer_after_the_window(mock_groq):
+    mock_groq(latency="fixed:0.6")
+    text = "Hedging: a slow answer."
+    pending = submit(text, hedge_window=0.1)
+    assert pending.local == local_feedback(text, 1)
+    time.sleep(0.2)
+    assert pending.settled()
+    assert pending.shown_text() == pending.local
+
+    # Groq's late answer is not shown, but it is cached for next time
+    assert finish(pending) in REPLIES
+    assert pending.shown_text() == pending.local
+    assert submit(text).result() == pending.result()
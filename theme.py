@@ -0,0 +1,88 @@
+import hashlib
+import re
+from functools import lru_cache
+from pathlib import Path
+from string import Template
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11; toml ships with streamlit
+    import toml as tomllib
+
+CONFIG_PATH = Path(__file__).parent / "config.toml"
+
+# Stylesheets are pushed into the page <head> by this component and stay there
+# across reruns, so each one crosses the websocket once per session
+_style_component = components.declare_component(
+    "style_injector",
+    path=str(Path(__file__).parent / "frontend" / "style"),
+)
+
+
+@lru_cache(maxsize=1)
+def theme_colours():
+    """Read the [theme] colours from config.toml as $names for CSS templates"""
+    try:
+        with open(CONFIG_PATH, "rb") as f:
+            theme = tomllib.load(f).get("theme", {})
+    except (OSError, ValueError):
+        theme = {}
+    return {
+        "primary": theme.get("primaryColor", "#00ffff"),
+        "background": theme.get("backgroundColor", "#0c0c0c"),
+        "secondary_background": theme.get("secondaryBackgroundColor", "#1a0033"),
+        "text": theme.get("textColor", "#ffffff"),
+    }
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace from CSS"""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};:,>])\s*", r"\1", css)
+    css = css.replace(";}", "}")
+    return css.strip()
+
+
+@lru_cache(maxsize=64)
+def build_stylesheet(css):
+    """Minify CSS and return (content hash, minified CSS)"""
+    minified = minify_css(css)
+    return hashlib.sha256(minified.encode("utf-8")).hexdigest()[:12], minified
+
+
+def themed_css(template):
+    """Fill a CSS template's $primary, $background, ... from config.toml"""
+    return Template(template).substitute(theme_colours())
+
+
+def use_style(slot, css):
+    """Make sure the page has this CSS in the given slot, sending it only when it changed
+
+    Each slot ("app", "page", ...) holds one stylesheet; using a slot again
+    with different CSS replaces what was there.
+    """
+    css_hash, minified = build_stylesheet(css)
+    key = f"style_{slot}"
+    sent_key = f"style_sent_{slot}"
+    # What was sent is recorded as it goes out, so the usual case needs no word
+    # back from the browser (that would cost a full rerun per page and day)
+    send = st.session_state.get(sent_key) != css_hash
+    # The browser only speaks up when the stylesheet it was told it has is
+    # missing, e.g. because the run that sent it was cut short by a rerun
+    missing = st.session_state.get(key)
+    if missing and missing["at"] != st.session_state.get(f"style_missing_{slot}"):
+        st.session_state[f"style_missing_{slot}"] = missing["at"]
+        send = True
+    _style_component(
+        slot=slot,
+        hash=css_hash,
+        css=minified if send else None,
+        key=key,
+        default=None,
+    )
+    if send:
+        st.session_state[sent_key] = css_hash
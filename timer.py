@@ -0,0 +1,45 @@
+import time
+from pathlib import Path
+
+import streamlit.components.v1 as components
+
+# The countdown ticks in the browser, so a running timer costs no script reruns.
+# The server only hears from it at start, stop (regular buttons) and completion.
+_countdown_component = components.declare_component(
+    "countdown_timer",
+    path=str(Path(__file__).parent / "frontend" / "timer"),
+)
+
+# Allowed difference between the browser and server clocks when the browser
+# reports that a countdown has finished
+COMPLETION_TOLERANCE = 2
+
+
+def countdown_timer(duration, started_at, color, glow=None, audio=None, key=None):
+    """Render a client-side countdown and return True once it has finished
+
+    If audio is a URL, the browser loops it while the countdown runs; it stops
+    when the countdown ends or the timer is no longer rendered (stop / reset).
+    """
+    elapsed = time.time() - started_at
+    remaining = max(0, duration - elapsed)
+
+    if remaining <= 0:
+        return True
+
+    event = _countdown_component(
+        duration=duration,
+        remaining=remaining,
+        run=started_at,
+        color=color,
+        glow=glow,
+        audio=audio,
+        key=key,
+        default=None,
+    )
+
+    # Ignore stale completions left over from an earlier (stopped or reset) run
+    if event and event.get("event") == "complete" and event.get("run") == started_at:
+        return remaining <= COMPLETION_TOLERANCE
+
+    return False
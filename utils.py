@@ -1,50 +1,459 @@
 import groq
+import httpx
 import os
+import queue
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from pathlib import Path
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from feedback_cache import FeedbackCache
+from circuit_breaker import CircuitBreaker
+from feedback_scheduler import FairScheduler, QueueFull
+from local_feedback import local_feedback
+from prompt_builder import fit_to_budget
+from model_router import ModelRouter, RATE_LIMIT_COOLDOWN, RETIRED_COOLDOWN
+
+# Last resort if even the local engine (local_feedback.py) fails. Whenever Groq
+# cannot answer, the local engine's day-aware pick is shown instead.
+FALLBACK_FEEDBACK = "💙 Your reflection is meaningful. Every step of self-discovery matters."
+
+# Models feedback may be routed to, most preferred first
+FEEDBACK_MODELS = ("llama3-8b-8192", "llama-3.1-8b-instant", "gemma2-9b-it")
+# Answers from any of them are interchangeable, so the cache is keyed on the first
+FEEDBACK_MODEL = FEEDBACK_MODELS[0]
+
+# Shared by every session: each request goes to the fastest healthy model by
+# rolling p50/p95 latency and error rate; model_router.decisions() shows why
+model_router = ModelRouter(FEEDBACK_MODELS)
+
+# Identical reflections are answered from here instead of a new paid Groq call
+feedback_cache = FeedbackCache(disk_dir=Path("data") / "feedback_cache")
+
+# AI feedback runs on these background threads so the page never waits on Groq
+FEEDBACK_WORKERS = 8
+_feedback_executor = ThreadPoolExecutor(max_workers=FEEDBACK_WORKERS, thread_name_prefix="groq-feedback")
+
+# At most this many Groq calls are in flight at once; the rest wait in a line
+# that takes turns between users, and submissions past its length fall back
+FEEDBACK_MAX_RUNNING = 4
+FEEDBACK_MAX_WAITING = 32
+feedback_scheduler = FairScheduler(
+    _feedback_executor, max_running=FEEDBACK_MAX_RUNNING, max_waiting=FEEDBACK_MAX_WAITING
+)
+
+# cache key -> PendingFeedback still streaming; identical prompts submitted
+# meanwhile (double clicks, reruns, other sessions) share it instead of a new call
+_inflight_feedback = {}
+_inflight_lock = threading.Lock()
+
+# Rate-limited (429) calls are retried after the server's Retry-After plus a
+# random backoff, so queued sessions don't all come back at the same moment
+RATE_LIMIT_ATTEMPTS = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8
+
+# Seconds between refreshes of a pending feedback slot while tokens stream in
+FEEDBACK_POLL_INTERVAL = 0.25
+
+# Hedged feedback (opt-in): with a number of seconds here, the local engine's
+# answer is shown as soon as a reflection is submitted, and Groq's replaces it
+# only if it completes within that window; later answers are still cached but
+# not shown. Hedging hides the streamed tokens and the queue position, so by
+# default (None) the slot streams Groq's answer as it arrives instead.
+FEEDBACK_HEDGE_WINDOW = None
+
+# Longest a single feedback call may take, start to last token, before the
+# fallback is shown instead (the client's own default timeout is minutes)
+FEEDBACK_DEADLINE = 10
+
+# Shared by every session: after repeated Groq failures, feedback falls back at
+# once for a cool-down, then a single request probes whether Groq has recovered
+groq_breaker = CircuitBreaker(failure_threshold=3, cooldown=30)
+
+# One Groq client is shared by every session in the process, so reflections
+# reuse pooled keep-alive connections instead of paying a TLS handshake each time
+_client = None
+_client_settings = None
+_client_lock = threading.Lock()
+
+# Connection pool for the shared client
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+KEEPALIVE_EXPIRY = 60
+
+def _get_setting(name):
+    """Read a setting from Streamlit secrets or the environment"""
+    # Try Streamlit secrets first (for Hugging Face)
+    try:
+        if hasattr(st, 'secrets') and name in st.secrets:
+            return st.secrets[name]
+    except Exception:
+        # No secrets.toml at all, e.g. local runs and benchmarks
+        pass
+    # Fallback to environment variable
+    return os.getenv(name)
+
+def get_groq_api_key():
+    """Read the Groq API key from Streamlit secrets or the environment"""
+    return _get_setting('GROQ_API_KEY')
+
+def get_groq_base_url():
+    """Groq endpoint override, e.g. http://127.0.0.1:8765 for mock_groq.py; None for the real API"""
+    return _get_setting('GROQ_BASE_URL') or None
 
 def get_groq_client():
-    """Initialize Groq client with API key from environment or secrets"""
+    """Return the shared Groq client, rebuilding it if the API key or base URL changed"""
+    global _client, _client_settings
     try:
-        # Try to get API key from Streamlit secrets first (for Hugging Face)
-        if hasattr(st, 'secrets') and 'GROQ_API_KEY' in st.secrets:
-            api_key = st.secrets['GROQ_API_KEY']
-        else:
-            # Fallback to environment variable
-            api_key = os.getenv('GROQ_API_KEY')
+        api_key = get_groq_api_key()
         
         if not api_key:
             return None
-            
-        return groq.Groq(api_key=api_key)
+        
+        settings = (api_key, get_groq_base_url())
+        with _client_lock:
+            if _client is None or settings != _client_settings:
+                # The previous client is left for garbage collection rather than
+                # closed, since another script thread may still be using it
+                _client = groq.Groq(
+                    api_key=api_key,
+                    base_url=settings[1],
+                    # Retries would run past the per-call deadline; the circuit
+                    # breaker decides when Groq is worth trying again
+                    max_retries=0,
+                    http_client=groq.DefaultHttpxClient(
+                        limits=httpx.Limits(
+                            max_connections=MAX_CONNECTIONS,
+                            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                            keepalive_expiry=KEEPALIVE_EXPIRY,
+                        )
+                    ),
+                )
+                _client_settings = settings
+            return _client
     except Exception as e:
         st.error(f"Error initializing Groq client: {e}")
         return None
 
-def get_groq_feedback(user_text):
-    """Get AI feedback from Groq API"""
-    client = get_groq_client()
-    
-    if not client:
-        return "💙 Your reflection is meaningful. Every step of self-discovery matters."
-    
+def reset_groq_client():
+    """Drop the shared Groq client so the next call builds a fresh one"""
+    global _client, _client_settings
+    with _client_lock:
+        _client = None
+        _client_settings = None
+
+def _build_feedback_messages(user_text):
+    """Build the chat messages asking for feedback on a reflection"""
+    # Long pastes are trimmed to a fixed token budget so latency and cost stay predictable
     prompt = (
         "The user wrote this reflection:\n"
-        f"{user_text}\n\n"
+        f"{fit_to_budget(user_text)}\n\n"
         "Give a short, empathetic motivational quote or feedback (max 2 sentences) that fits their feelings or thoughts. "
         "Be positive and supportive."
     )
+    return [
+        {"role": "system", "content": "You are a supportive mental wellness coach."},
+        {"role": "user", "content": prompt}
+    ]
+
+def _feedback_cache_key(user_text):
+    return FeedbackCache.make_key(FEEDBACK_MODEL, _build_feedback_messages(user_text))
+
+class ModelUnavailable(Exception):
+    """The routed model is retired or unknown; another model may still answer"""
+
+def _retry_after(error):
+    """Seconds a 429 response asks us to wait, if it says"""
+    try:
+        return float(error.response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+def _call_with_rate_limit_retries(call, deadline):
+    """Run call(seconds_left), retrying rate-limited attempts while the deadline allows"""
+    give_up_at = time.monotonic() + deadline
+    for attempt in range(RATE_LIMIT_ATTEMPTS):
+        try:
+            return call(give_up_at - time.monotonic())
+        except ModelUnavailable:
+            # The router has already benched that model; try the next one at once
+            if attempt == RATE_LIMIT_ATTEMPTS - 1:
+                raise
+        except groq.RateLimitError as e:
+            retry_after = _retry_after(e)
+            wait_for = 0
+            if model_router.all_cooling():
+                # No other model to route to: hold back everyone's queued calls too
+                wait_for = retry_after or 0
+                if retry_after:
+                    feedback_scheduler.pause(retry_after)
+            delay = wait_for + random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+            if attempt == RATE_LIMIT_ATTEMPTS - 1 or time.monotonic() + delay >= give_up_at:
+                raise
+            time.sleep(delay)
+
+def _session_user(user_name):
+    """Who a request is queued for: the journey's name, else the browser session"""
+    if user_name:
+        return user_name
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else ""
+
+def get_groq_feedback(user_text, user_name=None, day=None):
+    """Get AI feedback from Groq API, waiting for it to finish"""
+    pending = submit_groq_feedback(user_text, user_name, day, hedge_window=None)
+    wait([pending._future])
+    return pending.result()
+
+def stream_groq_feedback(user_text, client=None, deadline=FEEDBACK_DEADLINE, day=None):
+    """Yield AI feedback from Groq token by token as it arrives
     
+    Errors from a broken stream, and a TimeoutError once the deadline (in
+    seconds, for the whole stream) has passed, are raised to the caller, which
+    has already shown part of the text and has to decide how to replace it.
+    Without Groq, the local engine's feedback for the day is yielded instead.
+    """
+    client = client or get_groq_client()
+    if not client or not groq_breaker.allow():
+        yield local_feedback(user_text, day)
+        return
+    
+    model = model_router.choose()
+    started = time.monotonic()
+    give_up_at = started + deadline
     try:
         response = client.chat.completions.create(
-            model="llama3-8b-8192",
-            messages=[
-                {"role": "system", "content": "You are a supportive mental wellness coach."},
-                {"role": "user", "content": prompt}
-            ],
+            model=model,
+            messages=_build_feedback_messages(user_text),
             max_tokens=80,
             temperature=0.8,
+            stream=True,
+            # Bounds the connection and each wait for a chunk
+            timeout=deadline,
+        )
+        for chunk in _chunks_until(response, give_up_at):
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
+    except groq.RateLimitError as e:
+        # Being throttled is not an outage, so the circuit breaker is left alone;
+        # the router skips this model until its limit resets
+        model_router.record_failure(
+            model, time.monotonic() - started, cooldown=_retry_after(e) or RATE_LIMIT_COOLDOWN
         )
-        return response.choices[0].message.content.strip()
+        raise
     except Exception as e:
-        # Return a fallback message if API fails
-        return "💙 Your reflection is meaningful. Every step of self-discovery matters."
\ No newline at end of file
+        if isinstance(e, groq.NotFoundError) or "decommissioned" in str(e):
+            # One model going away is not an outage of Groq as a whole
+            model_router.record_failure(model, time.monotonic() - started, cooldown=RETIRED_COOLDOWN)
+            raise ModelUnavailable(model) from e
+        model_router.record_failure(model, time.monotonic() - started)
+        groq_breaker.record_failure()
+        raise
+    model_router.record_success(model, time.monotonic() - started)
+    groq_breaker.record_success()
+
+def _chunks_until(response, give_up_at):
+    """Yield a stream's chunks, raising TimeoutError as soon as give_up_at passes
+
+    Each wait for a chunk may take up to the whole read timeout, so checking the
+    clock between chunks could let a stream that stalls late run to twice the
+    deadline. Chunks are read on a helper thread instead and waited for here
+    with only the time that is left; the helper closes the response once it is
+    told to stop or the stream ends.
+    """
+    chunks = queue.Queue()
+    stop = threading.Event()
+
+    def read():
+        try:
+            for chunk in response:
+                if stop.is_set():
+                    break
+                chunks.put((chunk, None))
+            chunks.put((None, None))
+        except Exception as e:
+            chunks.put((None, e))
+        finally:
+            response.close()
+
+    threading.Thread(target=read, name="groq-stream", daemon=True).start()
+    try:
+        while True:
+            try:
+                chunk, error = chunks.get(timeout=max(0.0, give_up_at - time.monotonic()))
+            except queue.Empty:
+                raise TimeoutError("Groq feedback missed its deadline") from None
+            if error is not None:
+                raise error
+            if chunk is None:
+                return
+            yield chunk
+    finally:
+        stop.set()
+
+class PendingFeedback:
+    """Handle to an AI feedback request streaming in the background"""
+    
+    def __init__(self, local=None, hedge_window=None):
+        self._future = None
+        # Text received so far, readable from the script thread while streaming
+        self.partial = ""
+        # Hedging: the local answer shown meanwhile, and until when Groq may replace it
+        self.local = local
+        self.hedge_until = time.monotonic() + hedge_window if local is not None else None
+        self._finished_at = None
+    
+    @classmethod
+    def ready(cls, text):
+        """A PendingFeedback that already holds its answer"""
+        pending = cls()
+        pending._future = Future()
+        pending._future.set_result(text)
+        return pending
+    
+    def done(self):
+        return self._future.done()
+    
+    def _mark_finished(self, future):
+        self._finished_at = time.monotonic()
+    
+    def settled(self):
+        """True once the text to show will not change any more"""
+        if self._future.done():
+            return True
+        return self.hedge_until is not None and time.monotonic() >= self.hedge_until
+    
+    def shown_text(self):
+        """The settled text: Groq's if it beat the hedge window, else the local answer"""
+        if self.local is None:
+            return self.result()
+        if not self._future.done():
+            return self.local
+        # The done callback may not have run yet if the call has only just finished
+        finished_at = self._finished_at or time.monotonic()
+        return self.result() if finished_at <= self.hedge_until else self.local
+    
+    def queue_position(self):
+        """Place in the line for Groq, or None once the request has started"""
+        return feedback_scheduler.position(self._future)
+    
+    def result(self):
+        """Return the feedback text, or None while the request is still running"""
+        if not self._future.done():
+            return None
+        try:
+            return self._future.result()
+        except Exception:
+            return FALLBACK_FEEDBACK
+
+def _collect_groq_feedback(client, user_text, pending, day=None):
+    """Stream feedback into a PendingFeedback, falling back if the stream breaks"""
+    fallback = local_feedback(user_text, day)
+    
+    def stream(seconds_left):
+        for token in stream_groq_feedback(user_text, client=client, deadline=seconds_left, day=day):
+            pending.partial += token
+    
+    try:
+        _call_with_rate_limit_retries(stream, FEEDBACK_DEADLINE)
+        feedback = pending.partial.strip()
+        if not feedback:
+            return fallback
+        # Only Groq's own answers are cached; the local pick is recomputed for free
+        if feedback != fallback:
+            feedback_cache.put(_feedback_cache_key(user_text), feedback)
+        return feedback
+    except Exception:
+        # A half-finished sentence is worse than the gentle fallback
+        return fallback
+
+def _forget_inflight(cache_key, pending):
+    with _inflight_lock:
+        if _inflight_feedback.get(cache_key) is pending:
+            del _inflight_feedback[cache_key]
+
+def submit_groq_feedback(user_text, user_name=None, day=None, hedge_window=FEEDBACK_HEDGE_WINDOW):
+    """Queue AI feedback to stream in the background and return a PendingFeedback
+    
+    While a request for the same prompt is still running, its PendingFeedback
+    is returned instead, so both callers share one upstream call and result.
+    With a hedge_window (seconds), the local answer is shown until Groq's arrives.
+    """
+    cache_key = _feedback_cache_key(user_text)
+    with _inflight_lock:
+        shared = _inflight_feedback.get(cache_key)
+    if shared is not None:
+        return shared
+    
+    cached = feedback_cache.get(cache_key)
+    if cached:
+        # Repeat submissions of the same text are answered without touching Groq
+        return PendingFeedback.ready(cached)
+    
+    if groq_breaker.rejecting():
+        # Groq is failing for everyone right now; answer locally instead of queueing
+        return PendingFeedback.ready(local_feedback(user_text, day))
+    
+    # The client is resolved here because st.secrets and st.error need the script thread
+    client = get_groq_client()
+    if not client:
+        # No API key: the local engine answers at once
+        return PendingFeedback.ready(local_feedback(user_text, day))
+    
+    if hedge_window is None:
+        pending = PendingFeedback()
+    else:
+        pending = PendingFeedback(local_feedback(user_text, day), hedge_window)
+    with _inflight_lock:
+        # Another thread may have started the same prompt while we got the client
+        shared = _inflight_feedback.get(cache_key)
+        if shared is not None:
+            return shared
+        try:
+            pending._future = feedback_scheduler.submit(
+                _session_user(user_name), _collect_groq_feedback, client, user_text, pending, day
+            )
+        except QueueFull:
+            # The line is already long; a gentle answer now beats a long wait
+            return PendingFeedback.ready(local_feedback(user_text, day))
+        _inflight_feedback[cache_key] = pending
+    # Added outside the lock, since they run at once if the call already finished
+    pending._future.add_done_callback(pending._mark_finished)
+    pending._future.add_done_callback(lambda future: _forget_inflight(cache_key, pending))
+    return pending
+
+def _show_feedback_quote(text):
+    st.markdown(f"""
+             <div class="motivational-quote">
+             {text}
+             </div>
+             """, unsafe_allow_html=True)
+
+@st.fragment(run_every=FEEDBACK_POLL_INTERVAL)
+def _poll_pending_feedback(pending, waiting_message):
+    """Re-run only this slot, showing tokens as they arrive, until the request finishes"""
+    if pending.settled():
+        # One full rerun renders the result and stops this fragment from polling
+        st.rerun()
+    if pending.local is not None:
+        # Hedged: the local answer holds the slot until Groq's is complete
+        _show_feedback_quote(pending.local)
+        return
+    if pending.partial:
+        _show_feedback_quote(pending.partial)
+        return
+    position = pending.queue_position()
+    if position:
+        _show_feedback_quote(f"💭 {waiting_message} You're number {position} in line.")
+    else:
+        _show_feedback_quote(f"💭 {waiting_message}")
+
+def show_ai_feedback(pending, waiting_message="AI is thinking..."):
+    """Render AI feedback in the motivational-quote slot, streaming it in if needed"""
+    if pending.settled():
+        _show_feedback_quote(pending.shown_text())
+    else:
+        _poll_pending_feedback(pending, waiting_message)